@@ -11,9 +11,10 @@ Example:
 
 import argparse
 import logging
-import time
+from functools import reduce
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from logger_config import setup_logging
@@ -21,9 +22,9 @@ from data_loader import load_portfolio_from_json
 from data_fetcher import CryptoCompareClient
 from risk_analyzer import (
     prices_to_returns,
-    annualized_volatility,
-    sharpe_ratio,
-    historical_var,
+    annualized_volatility_all,
+    sharpe_ratio_all,
+    historical_var_all,
     correlation_matrix,
     portfolio_volatility,
 )
@@ -48,6 +49,35 @@ def resolve_portfolio_path(path_str: str) -> Path:
     return path
 
 
+def align_price_series(price_series: dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Align price series on their common dates into one DataFrame.
+
+    Same result as ``pd.DataFrame(price_series).dropna(how="any")``, but
+    the date indexes are intersected rather than unioned and the prices
+    are copied into a preallocated array, so no NaN-filled union is built.
+    """
+    common = reduce(
+        lambda left, right: left.intersection(right),
+        (series.index for series in price_series.values()),
+    )
+    if not common.is_monotonic_increasing:
+        common = common.sort_values()
+
+    mat = np.empty((len(common), len(price_series)), dtype=float)
+    for j, series in enumerate(price_series.values()):
+        if not series.index.equals(common):
+            series = series.reindex(common)
+        mat[:, j] = series.to_numpy(dtype=float)
+
+    complete = ~np.isnan(mat).any(axis=1)
+    if not complete.all():
+        mat = mat[complete]
+        common = common[complete]
+
+    return pd.DataFrame(mat, index=common, columns=list(price_series))
+
+
 def main() -> None:
     """Parse arguments, fetch market data, compute risk metrics."""
     # Initialize logging (console + file)
@@ -136,9 +166,6 @@ def main() -> None:
             logger.error("Failed to fetch price for %s: %s", asset.symbol, exc)
             raise
 
-        # Simple rate limiting to avoid hitting the API too aggressively
-        time.sleep(0.5)
-
     portfolio.assets = updated_assets
     logger.info("Successfully fetched current prices for %d assets", len(updated_assets))
 
@@ -164,13 +191,11 @@ def main() -> None:
             logger.error("Failed to fetch historical data for %s: %s", asset.symbol, exc)
             raise
 
-        time.sleep(0.5)
-
     # ------------------------------------------------------------------
     # Align time series and compute returns
     # ------------------------------------------------------------------
     logger.info("Aligning %d assets on common dates...", len(price_series))
-    prices_df = pd.DataFrame(price_series).dropna(how="any")
+    prices_df = align_price_series(price_series)
     returns_df = prices_to_returns(prices_df)
     logger.info("Aligned to %d common dates", len(prices_df))
 
@@ -220,22 +245,15 @@ def main() -> None:
     logger.info("Risk metrics (per asset):")
     logger.info("-" * 74)
 
-    rows: list[dict[str, float | str]] = []
-    for symbol in returns_df.columns:
-        r = returns_df[symbol]
-        vol = annualized_volatility(r)
-        sharpe = sharpe_ratio(r, risk_free_rate=args.rf)
-        var = historical_var(r, confidence=args.confidence)
-
-        rows.append(
-            {
-                "asset": symbol,
-                "vol_ann": vol,
-                "sharpe": sharpe,
-                "VaR": var,
-            }
-        )
+    metrics_df = pd.DataFrame(
+        {
+            "vol_ann": annualized_volatility_all(returns_df),
+            "sharpe": sharpe_ratio_all(returns_df, risk_free_rate=args.rf),
+            "VaR": historical_var_all(returns_df, confidence=args.confidence),
+        }
+    ).rename_axis("asset")
 
+    for symbol, vol, sharpe, var in metrics_df.itertuples(name=None):
         logger.debug(
             "Metrics for %s: vol_ann=%.6f sharpe=%.6f VaR=%.6f",
             symbol,
@@ -244,19 +262,22 @@ def main() -> None:
             var,
         )
 
-    metrics_df = pd.DataFrame(rows).set_index("asset").round(4)
+    metrics_df = metrics_df.round(4)
 
     header = f"{'asset':8} {'vol_ann':>10} {'sharpe':>10} {'VaR':>10}"
     logger.info("  %s", header)
     logger.info("  %s", "-" * len(header))
 
-    for asset_name, row in metrics_df.iterrows():
+    metric_columns = metrics_df[["vol_ann", "sharpe", "VaR"]]
+    for asset_name, vol_ann, sharpe_val, var_val in metric_columns.itertuples(
+        name=None
+    ):
         logger.info(
             "  %-8s %10.4f %10.4f %10.4f",
             asset_name,
-            row["vol_ann"],
-            row["sharpe"],
-            row["VaR"],
+            vol_ann,
+            sharpe_val,
+            var_val,
         )
 
     logger.info("")
@@ -272,21 +293,24 @@ def main() -> None:
     # ------------------------------------------------------------------
     # Correlation matrix
     # ------------------------------------------------------------------
-    logger.info("Correlation matrix:")
-    logger.info("-" * 74)
-
     corr = correlation_matrix(returns_df).round(3)
     assets = list(corr.columns)
 
     # Header row 
     corr_header = "asset    " + " ".join(f"{a:>8}" for a in assets)
-    logger.info("  %s", corr_header)
-    logger.info("  %s", "-" * len(corr_header))
-
-    # Each row: asset name + correlation values
-    for idx, row in corr.iterrows():
-        row_vals = " ".join(f"{val:8.3f}" for val in row.values)
-        logger.info("  %-8s %s", idx, row_vals)
+    corr_lines = [
+        "Correlation matrix:",
+        "-" * 74,
+        f"  {corr_header}",
+        f"  {'-' * len(corr_header)}",
+    ]
+
+    # Each row: asset name + correlation values, emitted as one log record
+    corr_lines.extend(
+        f"  {idx:<8} " + " ".join(f"{val:8.3f}" for val in values)
+        for idx, values in zip(corr.index, corr.to_numpy())
+    )
+    logger.info("\n".join(corr_lines))
 
     logger.info("")
 
@@ -87,6 +87,36 @@ def annualized_volatility(
     return vol
 
 
+def annualized_volatility_all(
+    returns_df: pd.DataFrame,
+    periods_per_year: int = 365,
+) -> pd.Series:
+    """
+    Compute annualized volatility for every asset in one reduction.
+
+    Batch form of :func:`annualized_volatility`, so callers do not need
+    to loop over the columns of `returns_df`.
+
+    Args:
+        returns_df: DataFrame of periodic returns, one column per asset.
+        periods_per_year: Number of return observations per year.
+
+    Returns:
+        Series of annualized volatilities indexed by asset. NaN for
+        assets with fewer than 2 non-null observations.
+
+    Raises:
+        AssertionError: If `returns_df` is not a DataFrame or
+            `periods_per_year` is not positive.
+    """
+    assert isinstance(returns_df, pd.DataFrame), "returns_df must be a DataFrame"
+    assert periods_per_year > 0, "periods_per_year must be positive"
+
+    vol = returns_df.std(ddof=1) * np.sqrt(periods_per_year)
+    logger.debug("Annualized volatility computed for %d assets", len(vol))
+    return vol
+
+
 def sharpe_ratio(
     returns: pd.Series,
     risk_free_rate: float = 0.02,
@@ -130,6 +160,40 @@ def sharpe_ratio(
     return sharpe
 
 
+def sharpe_ratio_all(
+    returns_df: pd.DataFrame,
+    risk_free_rate: float = 0.02,
+    periods_per_year: int = 365,
+) -> pd.Series:
+    """
+    Compute the annualized Sharpe ratio for every asset in one reduction.
+
+    Batch form of :func:`sharpe_ratio`, so callers do not need to loop
+    over the columns of `returns_df`.
+
+    Args:
+        returns_df: DataFrame of periodic returns, one column per asset.
+        risk_free_rate: Annual risk-free rate (e.g. 0.02 for 2%).
+        periods_per_year: Number of return observations per year.
+
+    Returns:
+        Series of annualized Sharpe ratios indexed by asset. NaN for
+        assets with fewer than 2 non-null observations or zero volatility.
+
+    Raises:
+        AssertionError: If types or parameters are invalid.
+    """
+    assert isinstance(returns_df, pd.DataFrame), "returns_df must be a DataFrame"
+    assert periods_per_year > 0, "periods_per_year must be positive"
+    assert isinstance(risk_free_rate, (float, int)), "risk_free_rate must be numeric"
+
+    excess = returns_df - risk_free_rate / periods_per_year
+    denom = excess.std(ddof=1)
+    sharpe = (excess.mean() / denom * np.sqrt(periods_per_year)).where(denom != 0)
+    logger.debug("Sharpe ratio computed for %d assets", len(sharpe))
+    return sharpe
+
+
 def historical_var(returns: pd.Series, confidence: float = 0.95) -> float:
     """
     Compute historical Value at Risk (VaR) for a return series.
@@ -162,6 +226,36 @@ def historical_var(returns: pd.Series, confidence: float = 0.95) -> float:
     return var
 
 
+def historical_var_all(
+    returns_df: pd.DataFrame,
+    confidence: float = 0.95,
+) -> pd.Series:
+    """
+    Compute historical VaR for every asset in one reduction.
+
+    Batch form of :func:`historical_var`, so callers do not need to loop
+    over the columns of `returns_df`.
+
+    Args:
+        returns_df: DataFrame of periodic returns, one column per asset.
+        confidence: Confidence level between 0 and 1.
+
+    Returns:
+        Series of VaR values indexed by asset. NaN for assets without
+        non-null observations.
+
+    Raises:
+        AssertionError: If `returns_df` is not a DataFrame or
+            `confidence` is not in (0, 1).
+    """
+    assert isinstance(returns_df, pd.DataFrame), "returns_df must be a DataFrame"
+    assert 0.0 < confidence < 1.0, "confidence must be in (0, 1)"
+
+    var = returns_df.quantile(1 - confidence)
+    logger.debug("Historical VaR computed for %d assets", len(var))
+    return var
+
+
 def correlation_matrix(returns_df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute the correlation matrix between asset returns.
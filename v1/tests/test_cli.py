@@ -10,6 +10,7 @@ from pathlib import Path
 
 import pandas as pd
 
+import data_fetcher
 import main as v1_main
 
 
@@ -61,7 +62,7 @@ def test_cli_runs(monkeypatch, tmp_path: Path) -> None:
 
     monkeypatch.setattr(v1_main, "CryptoCompareClient", lambda: FakeClient())
     monkeypatch.setattr(v1_main, "setup_logging", _fake_setup_logging)
-    monkeypatch.setattr(v1_main.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
 
     argv = [
         "main.py",
@@ -73,3 +74,17 @@ def test_cli_runs(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(sys, "argv", argv)
 
     v1_main.main()
+
+
+def test_align_price_series_matches_dropna_union() -> None:
+    """Keep only dates present (and non-missing) in every series."""
+    dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(4)]
+    price_series = {
+        "ETH": pd.Series([1.0, 2.0, 3.0, float("nan")], index=dates),
+        "BTC": pd.Series([5.0, 6.0, 7.0], index=dates[1:]),
+    }
+
+    aligned = v1_main.align_price_series(price_series)
+    expected = pd.DataFrame(price_series).dropna(how="any")
+
+    pd.testing.assert_frame_equal(aligned, expected)
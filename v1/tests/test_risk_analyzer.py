@@ -7,8 +7,11 @@ import pytest
 from risk_analyzer import (
     prices_to_returns,
     annualized_volatility,
+    annualized_volatility_all,
     sharpe_ratio,
+    sharpe_ratio_all,
     historical_var,
+    historical_var_all,
     correlation_matrix,
     portfolio_volatility,
 )
@@ -53,6 +56,16 @@ class TestAnnualizedVolatility:
         vol = annualized_volatility(returns)
         assert np.isnan(vol)
 
+    def test_batch_matches_per_series(self):
+        """Test the batch form against per-column calls."""
+        returns = pd.DataFrame({
+            "ETH": [0.01, -0.02, 0.015, -0.01],
+            "BTC": [0.02, -0.01, 0.01, 0.0],
+        })
+        vols = annualized_volatility_all(returns)
+        for col in returns.columns:
+            assert vols[col] == pytest.approx(annualized_volatility(returns[col]))
+
 
 class TestSharpeRatio:
     """Tests for sharpe_ratio function."""
@@ -69,6 +82,18 @@ class TestSharpeRatio:
         sr = sharpe_ratio(returns)
         assert np.isnan(sr)
 
+    def test_batch_matches_per_series(self):
+        """Test the batch form against per-column calls."""
+        returns = pd.DataFrame({
+            "ETH": [0.01, -0.02, 0.015, -0.01, 0.03],
+            "BTC": [0.02, -0.01, 0.01, 0.0, 0.005],
+            "USDC": [0.0, 0.0, 0.0, 0.0, 0.0],
+        })
+        sharpes = sharpe_ratio_all(returns, risk_free_rate=0.03)
+        for col in returns.columns:
+            expected = sharpe_ratio(returns[col], risk_free_rate=0.03)
+            np.testing.assert_allclose(sharpes[col], expected, rtol=1e-12)
+
 
 class TestHistoricalVar:
     """Tests for historical_var function."""
@@ -85,6 +110,14 @@ class TestHistoricalVar:
         var = historical_var(returns)
         assert np.isnan(var)
 
+    def test_batch_matches_per_series(self):
+        """Test the batch form against per-column calls."""
+        rng = np.random.default_rng(0)
+        returns = pd.DataFrame(rng.normal(0, 0.02, (50, 3)), columns=list("ABC"))
+        var = historical_var_all(returns, confidence=0.9)
+        for col in returns.columns:
+            assert var[col] == historical_var(returns[col], confidence=0.9)
+
 
 class TestCorrelationMatrix:
     """Tests for correlation_matrix function."""
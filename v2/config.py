@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -53,6 +54,7 @@ class RiskConfig:
     days: int
     risk_free_rate: float
     confidence: float
+    use_log_returns: bool = False
 
 
 @dataclass
@@ -85,37 +87,34 @@ class Config:
 # ---------------------------------------------------------------------------
 
 
-def _default_config_dict() -> Dict[str, Any]:
-    """
-    Return a dictionary with default configuration values.
-
-    These defaults are used when some keys are missing in the YAML file.
-    """
-    return {
-        "app": {
-            "name": "DeFi Portfolio Risk Analyzer V2",
-            "log_file": "portfolio_analyzer_v2.log",
-        },
-        "data": {
-            "default_portfolio_path": "data/sample_portfolio.json",
-            "cache_dir": "cache",
-            "cache_ttl_seconds": 3600,
-        },
-        "risk": {
-            "days": 30,
-            "risk_free_rate": 0.02,
-            "confidence": 0.95,
-        },
-        "optimization": {
-            "target_return": 0.10,
-            "max_weight_per_asset": 0.30,
-            "short_selling_allowed": False,
-        },
-        "visualization": {
-            "theme": "plotly_dark",
-            "output_dir": "figures",
-        },
-    }
+# Default values used when some keys are missing in the YAML file. Built
+# once at import; _merge_dicts never mutates it, so it is safe to share.
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "app": {
+        "name": "DeFi Portfolio Risk Analyzer V2",
+        "log_file": "portfolio_analyzer_v2.log",
+    },
+    "data": {
+        "default_portfolio_path": "data/sample_portfolio.json",
+        "cache_dir": "cache",
+        "cache_ttl_seconds": 3600,
+    },
+    "risk": {
+        "days": 30,
+        "risk_free_rate": 0.02,
+        "confidence": 0.95,
+        "use_log_returns": False,
+    },
+    "optimization": {
+        "target_return": 0.10,
+        "max_weight_per_asset": 0.30,
+        "short_selling_allowed": False,
+    },
+    "visualization": {
+        "theme": "plotly_dark",
+        "output_dir": "figures",
+    },
+}
 
 
 # ---------------------------------------------------------------------------
@@ -175,12 +174,25 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     except yaml.YAMLError as exc:
         raise ValueError(f"Invalid YAML config file: {exc}") from exc
 
-    if not isinstance(data, dict):
+    # safe_load only ever builds plain dicts, so an identity check suffices.
+    if type(data) is not dict:
         raise ValueError("Top-level YAML structure must be a mapping (dict).")
 
     return data
 
 
+@lru_cache(maxsize=16)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Memoized :func:`_load_yaml` keyed by file identity.
+
+    The modification time and size are part of the key, so editing the
+    file invalidates the entry. The returned dict is shared between calls
+    and must be treated as read-only.
+    """
+    return _load_yaml(Path(path_str))
+
+
 # ---------------------------------------------------------------------------
 # Load config
 # ---------------------------------------------------------------------------
@@ -209,17 +221,19 @@ def load_config(path: str | Path = "config.yml") -> Config:
     cfg_path = Path(path)
     logger.info("Loading configuration from %s", cfg_path)
 
-    defaults = _default_config_dict()
     user_conf: Dict[str, Any] = {}
 
     if cfg_path.exists():
-        user_conf = _load_yaml(cfg_path)
+        stat = cfg_path.stat()
+        user_conf = _load_yaml_cached(
+            str(cfg_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
     else:
         logger.warning(
             "Config file %s not found. Using built-in defaults only.", cfg_path
         )
 
-    merged = _merge_dicts(defaults, user_conf)
+    merged = _merge_dicts(_DEFAULT_CONFIG, user_conf)
 
     # Build strongly-typed sections
     app_cfg = AppConfig(
@@ -237,6 +251,7 @@ def load_config(path: str | Path = "config.yml") -> Config:
         days=int(merged["risk"]["days"]),
         risk_free_rate=float(merged["risk"]["risk_free_rate"]),
         confidence=float(merged["risk"]["confidence"]),
+        use_log_returns=bool(merged["risk"]["use_log_returns"]),
     )
 
     optimization_cfg = OptimizationConfig(
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -20,9 +21,89 @@ from cache import load_cached_series, load_cached_series_allow_stale, save_serie
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Matches the worker count used for concurrent history fetches in main.py.
+_POOL_SIZE = 8
+
+# Default pacing for the CryptoCompare free tier.
+DEFAULT_RATE_PER_SECOND = 2.0
+DEFAULT_BURST = 4
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace API requests.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    :meth:`acquire` only sleeps when the bucket is empty, so a handful of
+    requests go out immediately and sustained traffic is held at ``rate``.
+    :meth:`backoff` halves the rate when the server signals throttling and
+    :meth:`recover` raises it back step by step after successful requests.
+    """
+
+    # Rate multiplier per successful request while below the initial rate.
+    RECOVERY_FACTOR: float = 1.25
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = 0.1) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Sustained number of requests allowed per second.
+            burst: Maximum number of requests allowed back-to-back.
+            min_rate: Lower bound for the rate after repeated backoffs.
+
+        Raises:
+            ValueError: If `rate` or `min_rate` is not positive, or `burst`
+                is below 1.
+        """
+        if rate <= 0 or min_rate <= 0:
+            raise ValueError("rate and min_rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        self.rate: float = float(rate)
+        self.max_rate: float = self.rate
+        self.burst: float = float(burst)
+        self.min_rate: float = min(float(min_rate), self.rate)
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available if needed."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            # Reserve the token up front so concurrent callers queue fairly.
+            self._tokens -= 1.0
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def backoff(self) -> None:
+        """Halve the sustained rate, down to ``min_rate``."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2.0)
+        logger.warning("Rate limited by API; slowing to %.2f req/s", self.rate)
+
+    def recover(self) -> None:
+        """Raise the rate one step back towards its initial value."""
+        with self._lock:
+            # Checked under the lock so a concurrent backoff is not lost.
+            if self.rate >= self.max_rate:
+                return
+            self.rate = rate = min(self.max_rate, self.rate * self.RECOVERY_FACTOR)
+        logger.debug("API rate recovering; now %.2f req/s", rate)
+
 
 class CryptoCompareClient:
     """
@@ -31,6 +112,8 @@ class CryptoCompareClient:
     The client supports fetching current spot prices as well as
     historical daily OHLC data for a given symbol and quote currency.
     A free tier (no API key) is sufficient for small academic projects.
+    Requests go through a pooled :class:`requests.Session`, so HTTP
+    connections are kept alive between calls.
     """
 
     BASE_URL: str = "https://min-api.cryptocompare.com/data"
@@ -44,6 +127,7 @@ class CryptoCompareClient:
         cache_ttl_seconds: int = 3600,
         offline: bool = False,
         refresh_cache: bool = False,
+        rate_limiter: Optional[TokenBucket] = None,
     ) -> None:
         """
         Initialize a new CryptoCompareClient instance.
@@ -57,6 +141,8 @@ class CryptoCompareClient:
                 requests (excluding the initial attempt).
             offline: If True, do not make HTTP requests and rely on cache.
             refresh_cache: If True, bypass cache reads and refresh from API.
+            rate_limiter: Token bucket shared by every request made through
+                this client. Defaults to the free-tier pacing.
 
         Example:
             >>> client = CryptoCompareClient(timeout=10, max_retries=1)
@@ -69,6 +155,13 @@ class CryptoCompareClient:
         self.cache_ttl_seconds = cache_ttl_seconds
         self.offline = offline
         self.refresh_cache = refresh_cache
+        self.rate_limiter = rate_limiter or TokenBucket(
+            DEFAULT_RATE_PER_SECOND, DEFAULT_BURST
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         logger.debug(
             "CryptoCompareClient initialized (timeout=%s, max_retries=%s)",
@@ -76,6 +169,22 @@ class CryptoCompareClient:
             self.max_retries,
         )
 
+    @property
+    def settings_key(self) -> tuple:
+        """
+        Settings that decide which prices this client returns.
+
+        Two clients with equal keys read the same API base and cache, so
+        results fetched through one are valid for the other.
+        """
+        return (
+            self.BASE_URL,
+            str(self.cache_dir) if self.cache_dir else None,
+            self.cache_ttl_seconds,
+            self.offline,
+            self.refresh_cache,
+        )
+
     def _get(
         self,
         endpoint: str,
@@ -84,8 +193,9 @@ class CryptoCompareClient:
         """
         Perform a GET request to a CryptoCompare API endpoint.
 
-        This method handles retries with exponential backoff and basic
-        error checking on the JSON response.
+        This method paces calls through the client's token bucket, handles
+        retries with exponential backoff and basic error checking on the
+        JSON response. An HTTP 429 also slows the token bucket down.
 
         Args:
             endpoint: Endpoint path (e.g. ``"/price"`` or ``"/v2/histoday"``).
@@ -108,13 +218,16 @@ class CryptoCompareClient:
 
         for attempt in range(self.max_retries + 1):
             try:
+                self.rate_limiter.acquire()
                 logger.debug("API GET %s (attempt %d)", url, attempt + 1)
-                response = requests.get(
+                response = self.session.get(
                     url,
                     params=params,
                     headers=headers,
                     timeout=self.timeout,
                 )
+                if response.status_code == 429:
+                    self.rate_limiter.backoff()
                 response.raise_for_status()
                 data: Dict[str, Any] = response.json()
 
@@ -122,6 +235,7 @@ class CryptoCompareClient:
                     # CryptoCompare-specific error format
                     raise ValueError(data.get("Message", "Unknown error"))
 
+                self.rate_limiter.recover()
                 return data
 
             except ValueError:
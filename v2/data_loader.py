@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List
 
@@ -19,6 +20,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_get_symbol_amount = itemgetter("symbol", "amount")
+_REQUIRED_ASSET_FIELDS = ("symbol", "amount", "crypto_id")
+_REQUIRED_ASSET_FIELD_SET = frozenset(_REQUIRED_ASSET_FIELDS)
+
 
 def load_portfolio_from_json(path: str | Path) -> "Portfolio":
     """
@@ -85,8 +90,9 @@ def load_portfolio_from_json(path: str | Path) -> "Portfolio":
 
     for i, item in enumerate(assets_data):
         try:
-            symbol: str = str(item["symbol"]).strip()
-            amount: float = float(item["amount"])
+            raw_symbol, raw_amount = _get_symbol_amount(item)
+            symbol: str = str(raw_symbol).strip()
+            amount: float = float(raw_amount)
         except KeyError as exc:
             raise KeyError(f"Asset #{i}: missing field {exc}") from exc
         except (TypeError, ValueError) as exc:
@@ -157,13 +163,14 @@ def validate_portfolio_data(data: Dict[str, Any]) -> List[str]:
             errors.append(f"Asset #{i}: must be a JSON object")
             continue
 
-        for field in ["symbol", "amount", "crypto_id"]:
-            if field not in asset:
-                errors.append(f"Asset #{i}: missing field '{field}'")
+        if not asset.keys() >= _REQUIRED_ASSET_FIELD_SET:
+            for field in _REQUIRED_ASSET_FIELDS:
+                if field not in asset:
+                    errors.append(f"Asset #{i}: missing field '{field}'")
 
         symbol = str(asset.get("symbol", "")).strip()
         crypto_id = str(asset.get("crypto_id", "")).strip()
-        amount = asset.get("amount", None)
+        amount = asset.get("amount")
 
         if not symbol:
             errors.append(f"Asset #{i}: 'symbol' must be non-empty")
@@ -10,11 +10,16 @@ Subcommands:
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List
 
+import numpy as np
 import pandas as pd
 
 from config import load_config
@@ -30,24 +35,25 @@ from output_writer import (
     write_metrics_csv,
     write_metrics_json,
 )
-from report_writer import write_html_report
 from risk_analyzer import (
-    annualized_volatility,
-    correlation_matrix,
-    historical_var,
-    portfolio_volatility,
+    compute_risk_bundle,
+    prices_to_log_returns,
     prices_to_returns,
-    sharpe_ratio,
-)
-from visualizer import (
-    plot_allocation_pie,
-    plot_correlation_heatmap,
-    plot_efficient_frontier,
-    plot_risk_bars,
 )
 
 logger = logging.getLogger(__name__)
 
+# Concurrency for API calls; pacing is handled by the client's token bucket.
+_MAX_FETCH_WORKERS = 8
+
+# (timestamp, portfolio, returns_df) keyed by client settings, portfolio file
+# and fetch options, in least-recently-used order.
+_MARKET_DATA_CACHE: Dict[tuple, tuple[float, object, pd.DataFrame]] = {}
+_MARKET_DATA_CACHE_SIZE = 8
+
+# Clients keyed by cache settings so repeated commands reuse one HTTP pool.
+_CLIENT_CACHE: Dict[tuple, CryptoCompareClient] = {}
+
 
 def add_common_args(parser: argparse.ArgumentParser) -> None:
     """Add shared CLI arguments for all subcommands."""
@@ -99,8 +105,15 @@ def resolve_existing_path(path_str: str, base_dir: Path) -> Path:
     return path
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
-    """Build the top-level CLI parser with subcommands."""
+    """
+    Build the top-level CLI parser with subcommands.
+
+    The parser is built once per process and reused; ``parse_args`` does
+    not mutate it, so repeated ``main()`` calls share the same instance.
+    Callers must not add arguments to the returned parser.
+    """
     parser = argparse.ArgumentParser(
         description="V2 - DeFi Portfolio Analyzer",
     )
@@ -202,6 +215,31 @@ def validate_cache_flags(args: argparse.Namespace) -> None:
         raise ValueError("Cannot use --offline and --refresh-cache together.")
 
 
+def get_client(cfg, offline: bool, refresh_cache: bool) -> CryptoCompareClient:
+    """
+    Return a shared API client for the given cache settings.
+
+    The client is created on first use and reused afterwards, which keeps
+    its HTTP connection pool warm across subcommands in the same process.
+    """
+    key = (
+        cfg.data.cache_dir,
+        cfg.data.cache_ttl_seconds,
+        offline,
+        refresh_cache,
+    )
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = CryptoCompareClient(
+            cache_dir=cfg.data.cache_dir,
+            cache_ttl_seconds=cfg.data.cache_ttl_seconds,
+            offline=offline,
+            refresh_cache=refresh_cache,
+        )
+        _CLIENT_CACHE[key] = client
+    return client
+
+
 def resolve_log_level(args: argparse.Namespace) -> str:
     """Resolve the desired console log level from CLI flags."""
     if args.quiet:
@@ -262,9 +300,34 @@ def _log_table(
     align: list[str] | None = None,
 ) -> None:
     """Log a title followed by a formatted table."""
-    logger.info(title)
-    for line in _format_table(headers, rows, align):
-        logger.info(line)
+    logger.info("\n".join([title, *_format_table(headers, rows, align)]))
+
+
+def _require_crypto_ids(assets: Iterable) -> List[str]:
+    """Return the crypto_id of each asset, failing fast on missing ids."""
+    crypto_ids = []
+    for asset in assets:
+        if not asset.crypto_id:
+            raise ValueError(f"Missing 'crypto_id' for asset '{asset.symbol}'.")
+        crypto_ids.append(asset.crypto_id)
+    return crypto_ids
+
+
+def _fetch_concurrently(
+    fetch: Callable[[str], object],
+    crypto_ids: Iterable[str],
+) -> Dict[str, object]:
+    """
+    Run ``fetch`` once per distinct crypto_id on a thread pool.
+
+    Requests are I/O-bound, so they overlap on worker threads while the
+    client's shared token bucket keeps the overall request rate polite.
+    """
+    unique_ids = list(dict.fromkeys(crypto_ids))
+    workers = max(1, min(len(unique_ids), _MAX_FETCH_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(fetch, unique_ids))
+    return dict(zip(unique_ids, results))
 
 
 def load_portfolio_with_prices(
@@ -275,110 +338,167 @@ def load_portfolio_with_prices(
 ) -> object:
     """Load a portfolio JSON file and attach prices."""
     portfolio = load_portfolio_from_json(portfolio_path)
+    crypto_ids = _require_crypto_ids(portfolio.assets)
 
-    updated_assets: List[type(portfolio.assets[0])] = []
-    for asset in portfolio.assets:
-        crypto_id = asset.crypto_id
-        if not crypto_id:
-            raise ValueError(f"Missing 'crypto_id' for asset '{asset.symbol}'.")
-
-        if offline:
+    if offline:
+        def fetch_price(crypto_id: str) -> float:
             history = client.get_historical_daily(symbol=crypto_id, days=days)
-            current_price = float(history["price"].iloc[-1])
-        else:
-            current_price = client.get_current_price(symbol=crypto_id)
-        updated_assets.append(
-            type(asset)(
-                symbol=asset.symbol,
-                amount=asset.amount,
-                price=current_price,
-                crypto_id=crypto_id,
-            )
-        )
-        if not offline:
-            time.sleep(0.5)
+            return float(history["price"].iloc[-1])
+    else:
+        def fetch_price(crypto_id: str) -> float:
+            return client.get_current_price(symbol=crypto_id)
+
+    prices = _fetch_concurrently(fetch_price, crypto_ids)
 
-    portfolio.assets = updated_assets
+    portfolio.assets = [
+        replace(asset, price=prices[asset.crypto_id]) for asset in portfolio.assets
+    ]
     return portfolio
 
 
+def _align_price_series(price_series: Dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Align price series on their common dates into one DataFrame.
+
+    Equivalent to ``pd.DataFrame(price_series).dropna(how="any")`` but
+    intersects the date indexes instead of building their union, and
+    fills a preallocated buffer column by column. When every series
+    shares the same calendar (the usual case) no reindexing happens.
+    """
+    common = reduce(
+        lambda left, right: left.intersection(right),
+        (series.index for series in price_series.values()),
+    )
+    if not common.is_monotonic_increasing:
+        common = common.sort_values()
+
+    mat = np.empty((len(common), len(price_series)), dtype=float)
+    for j, series in enumerate(price_series.values()):
+        if not series.index.equals(common):
+            series = series.reindex(common)
+        mat[:, j] = series.to_numpy(dtype=float)
+
+    complete = ~np.isnan(mat).any(axis=1)
+    if not complete.all():
+        mat = mat[complete]
+        common = common[complete]
+
+    return pd.DataFrame(mat, index=common, columns=list(price_series))
+
+
 def fetch_returns_df(
     client: CryptoCompareClient,
     portfolio,
     days: int,
     offline: bool = False,
+    log_returns: bool = False,
 ) -> pd.DataFrame:
-    """Fetch historical prices and return aligned return series."""
-    price_series: Dict[str, pd.Series] = {}
+    """Fetch historical prices and return aligned (simple or log) returns."""
+    crypto_ids = _require_crypto_ids(portfolio.assets)
 
-    for asset in portfolio.assets:
-        crypto_id = asset.crypto_id
-        if not crypto_id:
-            raise ValueError(f"Missing 'crypto_id' for asset '{asset.symbol}'.")
+    def fetch_history(crypto_id: str) -> pd.Series:
+        return client.get_historical_daily(symbol=crypto_id, days=days)["price"]
 
-        df_hist = client.get_historical_daily(symbol=crypto_id, days=days)
-        price_series[asset.symbol] = df_hist["price"]
-        if not offline:
-            time.sleep(0.5)
+    histories = _fetch_concurrently(fetch_history, crypto_ids)
+    price_series: Dict[str, pd.Series] = {
+        asset.symbol: histories[asset.crypto_id] for asset in portfolio.assets
+    }
 
-    prices_df = pd.DataFrame(price_series).dropna(how="any")
+    prices_df = _align_price_series(price_series)
     if len(prices_df) < 2:
         raise ValueError("Not enough data points after alignment")
 
+    if log_returns:
+        return prices_to_log_returns(prices_df)
     return prices_to_returns(prices_df)
 
 
-def build_metrics_df(
-    returns_df: pd.DataFrame,
-    rf: float,
-    confidence: float,
-) -> pd.DataFrame:
-    """Build a metrics DataFrame (volatility, Sharpe, VaR) per asset."""
-    rows: list[dict[str, float | str]] = []
-    for symbol in returns_df.columns:
-        r = returns_df[symbol]
-        rows.append(
-            {
-                "asset": symbol,
-                "vol_ann": annualized_volatility(r),
-                "sharpe": sharpe_ratio(r, risk_free_rate=rf),
-                "VaR": historical_var(r, confidence=confidence),
-            }
+def load_market_data(
+    client: CryptoCompareClient,
+    portfolio_path: str | Path,
+    days: int,
+    offline: bool = False,
+    refresh: bool = False,
+    ttl_seconds: int = 3600,
+    log_returns: bool = False,
+) -> tuple[object, pd.DataFrame]:
+    """
+    Load a priced portfolio and its aligned returns, memoized per process.
+
+    Entries are keyed by the client's settings, the portfolio file (path,
+    mtime), ``days``, ``offline`` and ``log_returns`` and expire after
+    ``ttl_seconds``, so running several subcommands in one session (tests,
+    notebooks) reuses the first fetch. At most
+    ``_MARKET_DATA_CACHE_SIZE`` entries are kept, least recently used
+    first out. ``refresh`` bypasses the memo, like ``--refresh-cache``
+    does for the on-disk cache. Callers receive copies and may mutate
+    them freely.
+    """
+    path = Path(portfolio_path)
+    try:
+        key = (
+            client.settings_key,
+            str(path.resolve()),
+            path.stat().st_mtime_ns,
+            days,
+            offline,
+            log_returns,
+        )
+    except OSError:
+        key = None  # let the loader report the missing file
+
+    now = time.monotonic()
+    # Popped and reinserted on a hit, so dict order tracks recent use.
+    cached = _MARKET_DATA_CACHE.pop(key, None) if key is not None else None
+    if cached is not None and not refresh and now - cached[0] <= ttl_seconds:
+        logger.debug("Reusing market data for %s", path)
+    else:
+        portfolio = load_portfolio_with_prices(client, path, days, offline=offline)
+        returns_df = fetch_returns_df(
+            client,
+            portfolio,
+            days,
+            offline=offline,
+            log_returns=log_returns,
         )
-    return pd.DataFrame(rows).set_index("asset").round(4)
+        cached = (now, portfolio, returns_df)
+    if key is not None:
+        if len(_MARKET_DATA_CACHE) >= _MARKET_DATA_CACHE_SIZE:
+            _MARKET_DATA_CACHE.pop(next(iter(_MARKET_DATA_CACHE)))
+        _MARKET_DATA_CACHE[key] = cached
+
+    _, portfolio, returns_df = cached
+    return copy.deepcopy(portfolio), returns_df.copy()
 
 
 def run_analyze(args: argparse.Namespace, cfg, base_dir: Path) -> None:
     """Run the analyze subcommand and export metrics/allocation."""
     params = resolve_params(args, cfg, base_dir)
     validate_cache_flags(args)
-    client = CryptoCompareClient(
-        cache_dir=cfg.data.cache_dir,
-        cache_ttl_seconds=cfg.data.cache_ttl_seconds,
-        offline=args.offline,
-        refresh_cache=args.refresh_cache,
-    )
+    client = get_client(cfg, args.offline, args.refresh_cache)
 
-    portfolio = load_portfolio_with_prices(
+    portfolio, returns_df = load_market_data(
         client,
         params["portfolio_path"],
         params["days"],
         offline=args.offline,
+        refresh=args.refresh_cache,
+        ttl_seconds=cfg.data.cache_ttl_seconds,
+        log_returns=cfg.risk.use_log_returns,
     )
-    returns_df = fetch_returns_df(
-        client,
-        portfolio,
-        params["days"],
-        offline=args.offline,
-    )
-    metrics_df = build_metrics_df(returns_df, params["rf"], params["confidence"])
-
     weights = portfolio.weights()
-    corr = correlation_matrix(returns_df).round(3)
+    bundle = compute_risk_bundle(
+        returns_df,
+        weights,
+        params["rf"],
+        params["confidence"],
+    )
+    metrics_df = bundle.metrics
+    corr = bundle.correlation.round(3)
 
     logger.info("Portfolio: %s", portfolio.name)
     logger.info("Total value: %.2f", portfolio.total_value())
-    logger.info("Portfolio volatility: %.4f", portfolio_volatility(returns_df, weights))
+    logger.info("Portfolio volatility: %.4f", bundle.portfolio_volatility)
 
     outdir = Path(params["outdir"])
     if args.format == "csv":
@@ -394,16 +514,11 @@ def run_analyze(args: argparse.Namespace, cfg, base_dir: Path) -> None:
 
     if args.pretty:
         logger.info("")
-        metrics_rows = []
-        for asset, row in metrics_df.iterrows():
-            metrics_rows.append(
-                [
-                    asset,
-                    f"{row['vol_ann']:.4f}",
-                    f"{row['sharpe']:.4f}",
-                    f"{row['VaR']:.4f}",
-                ]
-            )
+        metrics_values = metrics_df[["vol_ann", "sharpe", "VaR"]].to_numpy()
+        metrics_rows = [
+            [asset, *(f"{value:.4f}" for value in values)]
+            for asset, values in zip(metrics_df.index, metrics_values)
+        ]
         _log_table(
             "Metrics (per asset):",
             ["asset", "vol_ann", "sharpe", "VaR"],
@@ -427,34 +542,27 @@ def run_analyze(args: argparse.Namespace, cfg, base_dir: Path) -> None:
         )
         logger.info("")
 
-    logger.info("Correlation matrix:")
-    for idx, row in corr.iterrows():
-        row_vals = " ".join(f"{val:8.3f}" for val in row.values)
-        logger.info("  %-8s %s", idx, row_vals)
+    lines = [
+        f"  {idx:<8} " + " ".join(f"{val:8.3f}" for val in values)
+        for idx, values in zip(corr.index, corr.to_numpy())
+    ]
+    logger.info("\n".join(["Correlation matrix:", *lines]))
 
 
 def run_optimize(args: argparse.Namespace, cfg, base_dir: Path) -> None:
     """Run the optimize subcommand and export optimal allocation."""
     params = resolve_params(args, cfg, base_dir)
     validate_cache_flags(args)
-    client = CryptoCompareClient(
-        cache_dir=cfg.data.cache_dir,
-        cache_ttl_seconds=cfg.data.cache_ttl_seconds,
-        offline=args.offline,
-        refresh_cache=args.refresh_cache,
-    )
+    client = get_client(cfg, args.offline, args.refresh_cache)
 
-    portfolio = load_portfolio_with_prices(
+    portfolio, returns_df = load_market_data(
         client,
         params["portfolio_path"],
         params["days"],
         offline=args.offline,
-    )
-    returns_df = fetch_returns_df(
-        client,
-        portfolio,
-        params["days"],
-        offline=args.offline,
+        refresh=args.refresh_cache,
+        ttl_seconds=cfg.data.cache_ttl_seconds,
+        log_returns=cfg.risk.use_log_returns,
     )
     bounds = build_bounds(cfg, returns_df.shape[1])
 
@@ -504,48 +612,42 @@ def run_optimize(args: argparse.Namespace, cfg, base_dir: Path) -> None:
 
 def run_visualize(args: argparse.Namespace, cfg, base_dir: Path) -> None:
     """Run the visualize subcommand and save plots."""
+    # Imported here so analyze/optimize do not pay matplotlib's import cost.
+    from visualizer import plot_all, set_chart_cache_dir
+
     params = resolve_params(args, cfg, base_dir)
     validate_cache_flags(args)
-    client = CryptoCompareClient(
-        cache_dir=cfg.data.cache_dir,
-        cache_ttl_seconds=cfg.data.cache_ttl_seconds,
-        offline=args.offline,
-        refresh_cache=args.refresh_cache,
-    )
+    client = get_client(cfg, args.offline, args.refresh_cache)
 
-    portfolio = load_portfolio_with_prices(
+    portfolio, returns_df = load_market_data(
         client,
         params["portfolio_path"],
         params["days"],
         offline=args.offline,
+        refresh=args.refresh_cache,
+        ttl_seconds=cfg.data.cache_ttl_seconds,
+        log_returns=cfg.risk.use_log_returns,
     )
-    returns_df = fetch_returns_df(
-        client,
-        portfolio,
-        params["days"],
-        offline=args.offline,
-    )
-    metrics_df = build_metrics_df(returns_df, params["rf"], params["confidence"])
-
     weights = portfolio.weights()
-    mean_returns = returns_df.mean() * 365
-    weights_series = pd.Series(weights).reindex(mean_returns.index).fillna(0.0)
-    portfolio_return = float(mean_returns @ weights_series)
-    portfolio_vol = portfolio_volatility(returns_df, weights)
+    bundle = compute_risk_bundle(
+        returns_df, weights, params["rf"], params["confidence"]
+    )
+    metrics_df = bundle.metrics
+    portfolio_return = float(bundle.mean_returns @ bundle.weights) * 365
+    portfolio_vol = bundle.portfolio_volatility
     portfolio_sharpe = (
         (portfolio_return - params["rf"]) / portfolio_vol
         if portfolio_vol > 0
         else float("nan")
     )
-    corr = correlation_matrix(returns_df)
+    corr = bundle.correlation
     bounds = build_bounds(cfg, returns_df.shape[1])
     frontier = efficient_frontier(returns_df, num_points=20, bounds=bounds)
 
     outdir = Path(params["outdir"])
-    plot_risk_bars(metrics_df, outdir / "risk_bars.png")
-    plot_correlation_heatmap(corr, outdir / "correlation_heatmap.png")
-    plot_allocation_pie(weights, outdir / "allocation.png")
-    plot_efficient_frontier(frontier, outdir / "frontier.png")
+    # Reruns over unchanged data reuse charts rendered under the API cache.
+    set_chart_cache_dir(Path(cfg.data.cache_dir) / "charts")
+    image_paths = plot_all(metrics_df, corr, weights, frontier, outdir)
 
     if args.format == "csv":
         write_dataframe_csv(frontier, outdir / "frontier.csv")
@@ -553,13 +655,9 @@ def run_visualize(args: argparse.Namespace, cfg, base_dir: Path) -> None:
         write_dataframe_json(frontier, outdir / "frontier.json", orient="records")
 
     if args.report:
+        from report_writer import write_html_report
+
         report_path = outdir / "report.html"
-        image_paths = {
-            "risk_bars": outdir / "risk_bars.png",
-            "correlation_heatmap": outdir / "correlation_heatmap.png",
-            "allocation": outdir / "allocation.png",
-            "frontier": outdir / "frontier.png",
-        }
         write_html_report(
             report_path,
             cfg.app.name,
@@ -5,16 +5,32 @@ Portfolio optimization utilities (Markowitz).
 from __future__ import annotations
 
 import logging
+import weakref
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize
+
+from risk_analyzer import frame_digest
 
 logger = logging.getLogger(__name__)
+# scipy.optimize is imported inside the solver helpers: it is slow to load
+# and not needed by callers that only use the moment helpers.
 _SOLVER_OPTIONS = {"maxiter": 2000, "ftol": 1e-9}
 
+# Annualized (mean, covariance) arrays, in the column order of returns_df.
+Moments = Tuple[np.ndarray, np.ndarray]
+
+# Moments of recently optimized frames, keyed by id(returns_df). The weak
+# reference guards against id reuse after the frame is garbage collected and
+# the content digest against the frame being edited in place.
+_MOMENTS_CACHE: Dict[int, tuple[weakref.ref, bytes, Moments]] = {}
+_MOMENTS_CACHE_SIZE = 8
+
+# Lower Cholesky factors of read-only (cached) covariance arrays.
+_CHOLESKY_CACHE: Dict[int, tuple[weakref.ref, np.ndarray]] = {}
+
 
 @dataclass(frozen=True)
 class OptimizationResult:
@@ -26,20 +42,156 @@ class OptimizationResult:
     sharpe: float
 
 
-def _annualized_mean(
-    returns_df: pd.DataFrame,
-    periods_per_year: int = 365,
-) -> pd.Series:
-    """Compute annualized mean returns."""
-    return returns_df.mean() * periods_per_year
+_COV_ESTIMATORS = ("sample", "ledoit_wolf")
+
 
+def _ledoit_wolf_cov(arr: np.ndarray) -> np.ndarray:
+    """
+    Return the Ledoit-Wolf shrunk covariance of ``arr`` (rows = observations).
 
-def _annualized_cov(
+    The empirical covariance is shrunk towards ``mu * I`` (``mu`` being
+    its average variance) with the optimal intensity from Ledoit & Wolf
+    (2004). This follows scikit-learn's ``LedoitWolf`` estimator, including
+    its ``1 / n`` normalization of the empirical covariance.
+    """
+    n_obs, n_assets = arr.shape
+    centered = arr - arr.mean(axis=0)
+    emp_cov = centered.T @ centered / n_obs
+    mu = np.trace(emp_cov) / n_assets
+
+    sq = centered**2
+    beta = (np.sum(sq.T @ sq) / n_obs - np.sum(emp_cov**2)) / (n_assets * n_obs)
+    delta = np.sum((emp_cov - mu * np.eye(n_assets)) ** 2) / n_assets
+    shrinkage = 0.0 if delta == 0 else min(beta, delta) / delta
+
+    shrunk = (1.0 - shrinkage) * emp_cov
+    shrunk.flat[:: n_assets + 1] += shrinkage * mu
+    return shrunk
+
+
+def annualized_moments(
     returns_df: pd.DataFrame,
     periods_per_year: int = 365,
-) -> pd.DataFrame:
-    """Compute annualized covariance matrix."""
-    return returns_df.cov() * periods_per_year
+    cov_estimator: str = "sample",
+    dtype: np.dtype | type = np.float64,
+) -> Moments:
+    """
+    Compute annualized mean returns and covariance as NumPy arrays.
+
+    NaN-free returns go straight through NumPy; returns with gaps skip NaN
+    as ``DataFrame.mean``/``DataFrame.cov`` do (pairwise-complete
+    covariance). The result can be passed as ``moments`` to the optimizers so several
+    solves on the same returns reuse one mean/covariance computation.
+
+    Args:
+        returns_df: Periodic returns, one column per asset.
+        periods_per_year: Annualization factor.
+        cov_estimator: ``"sample"`` for the unbiased sample covariance or
+            ``"ledoit_wolf"`` for a shrunk, better-conditioned estimate.
+        dtype: Floating dtype of the returned arrays. ``np.float32`` halves
+            their size for large universes; the moments are still computed
+            in double precision and SLSQP solves upcast them once.
+
+    Raises:
+        ValueError: If `cov_estimator` is not a supported estimator.
+    """
+    if cov_estimator not in _COV_ESTIMATORS:
+        raise ValueError(
+            f"cov_estimator must be one of {_COV_ESTIMATORS}, got {cov_estimator!r}"
+        )
+
+    arr = returns_df.to_numpy(dtype=float)
+    gaps = np.isnan(arr)
+    if not gaps.any():
+        mean_np = arr.mean(axis=0)
+        if cov_estimator == "ledoit_wolf":
+            cov_np = _ledoit_wolf_cov(arr)
+        else:
+            cov_np = np.atleast_2d(np.cov(arr, rowvar=False))
+    else:
+        # Assets listed on different dates leave gaps: skip NaN like pandas,
+        # with a pairwise-complete sample covariance. Ledoit-Wolf needs a
+        # rectangular sample, so it uses the rows complete for every asset.
+        mean_np = returns_df.mean().to_numpy(dtype=float)
+        if cov_estimator == "ledoit_wolf":
+            cov_np = _ledoit_wolf_cov(arr[~gaps.any(axis=1)])
+        else:
+            cov_np = returns_df.cov().to_numpy(dtype=float)
+    mean_np = mean_np * periods_per_year
+    cov_np = cov_np * periods_per_year
+    return mean_np.astype(dtype, copy=False), cov_np.astype(dtype, copy=False)
+
+
+def _cached_moments(returns_df: pd.DataFrame) -> Moments:
+    """
+    Return :func:`annualized_moments` for ``returns_df``, reusing prior work.
+
+    Several optimizers are often run on the same returns frame; the cache
+    lets them share a single covariance computation. Entries are matched
+    on object identity plus a digest of the values, so a frame edited in
+    place is recomputed, and the cached arrays are read-only.
+    """
+    key = id(returns_df)
+    digest = frame_digest(returns_df)
+    entry = _MOMENTS_CACHE.get(key)
+    if entry is not None:
+        ref, cached_digest, moments = entry
+        if ref() is returns_df and cached_digest == digest:
+            return moments
+
+    moments = annualized_moments(returns_df)
+    for arr in moments:
+        arr.setflags(write=False)
+    _MOMENTS_CACHE.pop(key, None)
+    if len(_MOMENTS_CACHE) >= _MOMENTS_CACHE_SIZE:
+        _MOMENTS_CACHE.pop(next(iter(_MOMENTS_CACHE)))
+    _MOMENTS_CACHE[key] = (weakref.ref(returns_df), digest, moments)
+    return moments
+
+
+def clear_moments_cache() -> None:
+    """Forget every memoized moment pair and Cholesky factor."""
+    _MOMENTS_CACHE.clear()
+    _CHOLESKY_CACHE.clear()
+
+
+def _cholesky_factor(cov_np: np.ndarray) -> np.ndarray:
+    """
+    Return the lower Cholesky factor of ``cov_np``.
+
+    Factors of read-only arrays (the cached moments) are memoized, so the
+    closed-form min-variance and frontier solves on the same returns share
+    one factorization.
+
+    Raises:
+        numpy.linalg.LinAlgError: If ``cov_np`` is not positive definite.
+    """
+    key = id(cov_np)
+    entry = _CHOLESKY_CACHE.get(key)
+    if entry is not None and entry[0]() is cov_np:
+        return entry[1]
+
+    factor = np.linalg.cholesky(cov_np)
+    if not cov_np.flags.writeable:
+        if len(_CHOLESKY_CACHE) >= _MOMENTS_CACHE_SIZE:
+            _CHOLESKY_CACHE.pop(next(iter(_CHOLESKY_CACHE)))
+        _CHOLESKY_CACHE[key] = (weakref.ref(cov_np), factor)
+    return factor
+
+
+def _cov_solve(cov_np: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Solve ``cov @ x = rhs`` through a (cached) Cholesky factorization.
+
+    Falls back to a general LU solve when ``cov`` is not positive definite.
+    """
+    from scipy.linalg import cho_solve
+
+    try:
+        factor = _cholesky_factor(cov_np)
+    except np.linalg.LinAlgError:
+        return np.linalg.solve(cov_np, rhs)
+    return cho_solve((factor, True), rhs)
 
 
 def _as_bounds(
@@ -50,165 +202,362 @@ def _as_bounds(
     return list(bounds) if bounds is not None else [(0.0, 1.0)] * n
 
 
-def _portfolio_volatility(weights: np.ndarray, cov: pd.DataFrame) -> float:
+def _portfolio_volatility(weights: np.ndarray, cov_np: np.ndarray) -> float:
     """Compute portfolio volatility for given weights and covariance."""
-    return float(np.sqrt(weights.T @ cov.values @ weights))
-
-
-def _min_expected_return(
-    returns_df: pd.DataFrame,
-    bounds: Iterable[tuple[float, float]] | None = None,
-) -> float:
-    """Compute the minimum feasible expected return under bounds."""
-    n = len(returns_df.columns)
-    mean_returns = _annualized_mean(returns_df)
-    bnds = _as_bounds(bounds, n)
-    constraints = ({"type": "eq", "fun": lambda w: np.sum(w) - 1.0},)
-    x0 = np.repeat(1.0 / n, n)
+    return float(np.sqrt(np.vdot(weights, cov_np @ weights)))
+
+
+def _variance_and_grad(
+    w: np.ndarray,
+    cov_np: np.ndarray,
+) -> tuple[float, np.ndarray]:
+    """Return ``w' @ cov @ w`` and its gradient from a single mat-vec."""
+    cov_w = cov_np @ w
+    return float(w @ cov_w), 2.0 * cov_w
+
+
+def _neg_sharpe_and_grad(
+    w: np.ndarray,
+    mean_np: np.ndarray,
+    cov_np: np.ndarray,
+    risk_free_rate: float,
+) -> tuple[float, np.ndarray]:
+    """Return the negative Sharpe ratio of ``w`` and its gradient."""
+    cov_w = cov_np @ w
+    port_vol = float(np.sqrt(w @ cov_w))
+    if port_vol == 0:
+        return float("inf"), np.zeros_like(w)
+    excess = float(w @ mean_np) - risk_free_rate
+    # d/dw of -excess / vol = -mean / vol + excess * cov_w / vol**3
+    grad = -mean_np / port_vol + excess * cov_w / port_vol**3
+    return -excess / port_vol, grad
+
+
+def _linear_equality(a_eq: np.ndarray, b_eq: np.ndarray) -> dict:
+    """
+    Return the SLSQP constraint ``a_eq @ w == b_eq`` with its constant Jacobian.
+
+    Stacking every linear equality into one vector-valued constraint means
+    SLSQP makes a single callback per evaluation instead of one per row.
+    """
+    return {"type": "eq", "fun": lambda w: a_eq @ w - b_eq, "jac": lambda w: a_eq}
+
+
+def _budget_constraint(n: int) -> dict:
+    """Return the fully-invested ``sum(w) == 1`` constraint."""
+    return _linear_equality(np.ones((1, n)), np.ones(1))
+
+
+def _solve_return_lp(
+    mean_np: np.ndarray,
+    bnds: list[tuple[float, float]],
+    sign: float,
+) -> np.ndarray:
+    """
+    Minimize ``sign * mean @ w`` over fully-invested weights within bounds.
+
+    Both extreme-return problems are linear programs, so they are solved
+    exactly with the HiGHS simplex solver instead of a generic NLP method.
+    """
+    from scipy.optimize import linprog
+
+    n = mean_np.shape[0]
+    result = linprog(
+        sign * mean_np,
+        A_eq=np.ones((1, n)),
+        b_eq=[1.0],
+        bounds=bnds,
+        method="highs",
+    )
+    if not result.success:
+        raise ValueError(result.message)
+    return result.x
+
+
+def _solve_qp(
+    cov_np: np.ndarray,
+    bnds: list[tuple[float, float]],
+    constraints: tuple[dict, ...],
+    x0: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Minimize ``w' @ cov @ w`` subject to equality constraints and bounds.
+
+    All variance-minimizing solves share this helper so the quadratic
+    objective and solver settings live in a single place. The objective
+    returns its analytic gradient alongside the value, so SLSQP does not
+    finite-difference it. ``x0`` seeds the solver (equal weights by default).
+    """
+    from scipy.optimize import minimize
+
+    # SLSQP iterates in double precision; upcast once so that every
+    # objective evaluation stays in a single dtype.
+    cov_np = np.asarray(cov_np, dtype=np.float64)
+    n = cov_np.shape[0]
+    if x0 is None:
+        x0 = np.repeat(1.0 / n, n)
 
     result = minimize(
-        lambda w: float(w @ mean_returns.values),
+        _variance_and_grad,
         x0,
+        args=(cov_np,),
+        jac=True,
         bounds=bnds,
         constraints=constraints,
         method="SLSQP",
         options=_SOLVER_OPTIONS,
     )
     if not result.success:
-        raise ValueError(f"Min-return optimization failed: {result.message}")
-    return float(result.x @ mean_returns.values)
+        raise ValueError(f"Optimization failed: {result.message}")
+    return result.x
+
+
+def _min_expected_return(
+    mean_np: np.ndarray,
+    bnds: list[tuple[float, float]],
+) -> float:
+    """Compute the minimum feasible expected return under bounds."""
+    try:
+        w = _solve_return_lp(mean_np, bnds, sign=1.0)
+    except ValueError as exc:
+        raise ValueError(f"Min-return optimization failed: {exc}") from exc
+    return float(w @ mean_np)
 
 
 def _max_expected_return(
-    returns_df: pd.DataFrame,
-    bounds: Iterable[tuple[float, float]] | None = None,
+    mean_np: np.ndarray,
+    bnds: list[tuple[float, float]],
 ) -> float:
     """Compute the maximum feasible expected return under bounds."""
-    n = len(returns_df.columns)
-    mean_returns = _annualized_mean(returns_df)
-    bnds = _as_bounds(bounds, n)
-    constraints = ({"type": "eq", "fun": lambda w: np.sum(w) - 1.0},)
-    x0 = np.repeat(1.0 / n, n)
+    try:
+        w = _solve_return_lp(mean_np, bnds, sign=-1.0)
+    except ValueError as exc:
+        raise ValueError(f"Max-return optimization failed: {exc}") from exc
+    return float(w @ mean_np)
 
-    result = minimize(
-        lambda w: -float(w @ mean_returns.values),
-        x0,
-        bounds=bnds,
-        constraints=constraints,
-        method="SLSQP",
-        options=_SOLVER_OPTIONS,
-    )
-    if not result.success:
-        raise ValueError(f"Max-return optimization failed: {result.message}")
-    return float(result.x @ mean_returns.values)
+
+def _bound_arrays(bnds: list[tuple[float, float]]) -> tuple[np.ndarray, np.ndarray]:
+    """Return lower and upper bound vectors, mapping ``None`` to infinity."""
+    lower = np.array([-np.inf if lo is None else lo for lo, _ in bnds], dtype=float)
+    upper = np.array([np.inf if hi is None else hi for _, hi in bnds], dtype=float)
+    return lower, upper
+
+
+def _closed_form_min_variance(
+    cov_np: np.ndarray,
+    bnds: list[tuple[float, float]],
+) -> np.ndarray | None:
+    """
+    Return the analytic fully-invested minimum-variance weights.
+
+    Solves the KKT system ``w = inv(cov) @ 1 / (1' @ inv(cov) @ 1)``. The
+    result is only returned when it already satisfies ``bnds`` (then it is
+    also the bounded optimum); otherwise, or if ``cov`` is singular,
+    ``None`` is returned so the caller can fall back to a numerical solve.
+    """
+    try:
+        x = _cov_solve(cov_np, np.ones(cov_np.shape[0]))
+    except np.linalg.LinAlgError:
+        return None
+
+    total = x.sum()
+    if not np.isfinite(total) or total == 0:
+        return None
+
+    w = x / total
+    lower, upper = _bound_arrays(bnds)
+    if np.all(w >= lower) and np.all(w <= upper):
+        return w
+    return None
+
+
+def _analytic_frontier_weights(
+    mean_np: np.ndarray,
+    cov_np: np.ndarray,
+    targets: np.ndarray,
+) -> np.ndarray | None:
+    """
+    Return unbounded min-variance weights for every target in one batch.
+
+    With only the budget and return equalities, the KKT conditions give
+    ``w(t) = inv(cov) @ [1, mean] @ inv(M) @ [1, t]`` where
+    ``M = [1, mean]' @ inv(cov) @ [1, mean]``, so all targets share two
+    linear solves. Rows are shaped ``(len(targets), n)``; ``None`` is
+    returned when either system is singular (e.g. identical means).
+    """
+    basis = np.column_stack([np.ones_like(mean_np), mean_np])
+    try:
+        cov_inv_basis = _cov_solve(cov_np, basis)
+        coeffs = np.linalg.solve(
+            basis.T @ cov_inv_basis,
+            np.vstack([np.ones_like(targets), targets]),
+        )
+    except np.linalg.LinAlgError:
+        return None
+    return (cov_inv_basis @ coeffs).T
 
 
 def min_variance(
     returns_df: pd.DataFrame,
     bounds: Iterable[tuple[float, float]] | None = None,
+    moments: Moments | None = None,
 ) -> OptimizationResult:
-    """Compute the minimum-variance portfolio under long-only bounds."""
-    assets = list(returns_df.columns)
-    n = len(assets)
-    mean_returns = _annualized_mean(returns_df)
-    cov = _annualized_cov(returns_df)
+    """
+    Compute the minimum-variance portfolio under long-only bounds.
 
-    constraints = ({"type": "eq", "fun": lambda w: np.sum(w) - 1.0},)
-    x0 = np.repeat(1.0 / n, n)
-    bnds = _as_bounds(bounds, n)
+    ``moments`` may carry precomputed :func:`annualized_moments` output.
+    """
+    assets = list(returns_df.columns)
+    mean_np, cov_np = moments if moments is not None else _cached_moments(returns_df)
+    bnds = _as_bounds(bounds, len(assets))
 
-    result = minimize(
-        lambda w: w.T @ cov.values @ w,
-        x0,
-        bounds=bnds,
-        constraints=constraints,
-        method="SLSQP",
-        options=_SOLVER_OPTIONS,
-    )
-    if not result.success:
-        raise ValueError(f"Optimization failed: {result.message}")
+    w = _closed_form_min_variance(cov_np, bnds)
+    if w is None:
+        w = _solve_qp(cov_np, bnds, (_budget_constraint(len(assets)),))
 
-    weights = dict(zip(assets, result.x))
-    expected_return = float(result.x @ mean_returns.values)
-    volatility = _portfolio_volatility(result.x, cov)
+    weights = dict(zip(assets, w))
+    expected_return = float(w @ mean_np)
+    volatility = _portfolio_volatility(w, cov_np)
     sharpe = (expected_return / volatility) if volatility > 0 else float("nan")
     return OptimizationResult(weights, expected_return, volatility, sharpe)
 
 
+def _max_sharpe_convex(
+    mean_np: np.ndarray,
+    cov_np: np.ndarray,
+    risk_free_rate: float,
+    bnds: list[tuple[float, float]],
+) -> np.ndarray | None:
+    """
+    Solve max-Sharpe as a convex QP via the Charnes-Cooper transform.
+
+    With ``y = w / k`` (``k > 0``) and the normalization
+    ``(mean - rf) @ y == 1``, maximizing the Sharpe ratio becomes
+    ``min y' @ cov @ y``; each bound ``lo <= w_i <= hi`` turns into the
+    homogeneous inequalities ``lo * sum(y) <= y_i <= hi * sum(y)``. The
+    weights are recovered as ``y / sum(y)``.
+
+    Returns ``None`` when no feasible portfolio beats the risk-free rate
+    (the transform needs a positive excess return) or the solve fails.
+    """
+    n = mean_np.shape[0]
+    excess = mean_np - risk_free_rate
+    try:
+        w_start = _solve_return_lp(excess, bnds, sign=-1.0)
+    except ValueError:
+        return None
+    best_excess = float(w_start @ excess)
+    if best_excess <= 0:
+        return None
+
+    ones = np.ones(n)
+    eye = np.eye(n)
+    rows = [ones]  # sum(y) >= 0 keeps the scale k non-negative
+    for i, (lo, hi) in enumerate(bnds):
+        if hi is not None:
+            rows.append(hi * ones - eye[i])
+        if lo is not None and lo != 0:
+            rows.append(eye[i] - lo * ones)
+    g_ineq = np.vstack(rows)
+    constraints = (
+        _linear_equality(excess[np.newaxis, :], np.ones(1)),
+        {"type": "ineq", "fun": lambda y: g_ineq @ y, "jac": lambda y: g_ineq},
+    )
+    y_bounds = [(0.0 if lo == 0 else None, None) for lo, _ in bnds]
+
+    try:
+        y = _solve_qp(cov_np, y_bounds, constraints, x0=w_start / best_excess)
+    except ValueError:
+        return None
+    total = y.sum()
+    if not np.isfinite(total) or total <= 0:
+        return None
+    return y / total
+
+
 def max_sharpe(
     returns_df: pd.DataFrame,
     risk_free_rate: float = 0.02,
     bounds: Iterable[tuple[float, float]] | None = None,
+    moments: Moments | None = None,
 ) -> OptimizationResult:
-    """Compute the maximum Sharpe ratio portfolio."""
+    """
+    Compute the maximum Sharpe ratio portfolio.
+
+    The convex Charnes-Cooper reformulation is tried first; the direct
+    (non-convex) Sharpe objective is only used when no portfolio beats the
+    risk-free rate. ``moments`` may carry precomputed
+    :func:`annualized_moments` output.
+    """
     assets = list(returns_df.columns)
     n = len(assets)
-    mean_returns = _annualized_mean(returns_df)
-    cov = _annualized_cov(returns_df)
-
-    constraints = ({"type": "eq", "fun": lambda w: np.sum(w) - 1.0},)
-    x0 = np.repeat(1.0 / n, n)
+    mean_np, cov_np = moments if moments is not None else _cached_moments(returns_df)
     bnds = _as_bounds(bounds, n)
 
-    def neg_sharpe(w: np.ndarray) -> float:
-        port_return = float(w @ mean_returns.values)
-        port_vol = _portfolio_volatility(w, cov)
-        if port_vol == 0:
-            return float("inf")
-        return -(port_return - risk_free_rate) / port_vol
-
-    result = minimize(
-        neg_sharpe,
-        x0,
-        bounds=bnds,
-        constraints=constraints,
-        method="SLSQP",
-        options=_SOLVER_OPTIONS,
-    )
-    if not result.success:
-        raise ValueError(f"Optimization failed: {result.message}")
-
-    weights = dict(zip(assets, result.x))
-    expected_return = float(result.x @ mean_returns.values)
-    volatility = _portfolio_volatility(result.x, cov)
+    w = _max_sharpe_convex(mean_np, cov_np, risk_free_rate, bnds)
+    if w is None:
+        from scipy.optimize import minimize
+
+        result = minimize(
+            _neg_sharpe_and_grad,
+            np.repeat(1.0 / n, n),
+            args=(
+                np.asarray(mean_np, dtype=np.float64),
+                np.asarray(cov_np, dtype=np.float64),
+                risk_free_rate,
+            ),
+            jac=True,
+            bounds=bnds,
+            constraints=(_budget_constraint(n),),
+            method="SLSQP",
+            options=_SOLVER_OPTIONS,
+        )
+        if not result.success:
+            raise ValueError(f"Optimization failed: {result.message}")
+        w = result.x
+
+    weights = dict(zip(assets, w))
+    expected_return = float(w @ mean_np)
+    volatility = _portfolio_volatility(w, cov_np)
     sharpe = (expected_return - risk_free_rate) / volatility if volatility > 0 else float(
         "nan"
     )
     return OptimizationResult(weights, expected_return, volatility, sharpe)
 
 
+def _target_return_core(
+    mean_np: np.ndarray,
+    cov_np: np.ndarray,
+    target: float,
+    bnds: list[tuple[float, float]],
+    x0: np.ndarray | None = None,
+) -> np.ndarray:
+    """Return min-variance weights hitting ``target`` on precomputed moments."""
+    a_eq = np.vstack([np.ones_like(mean_np), mean_np])
+    constraint = _linear_equality(a_eq, np.array([1.0, target]))
+    return _solve_qp(cov_np, bnds, (constraint,), x0=x0)
+
+
 def target_return(
     returns_df: pd.DataFrame,
     target_return: float,
     bounds: Iterable[tuple[float, float]] | None = None,
+    moments: Moments | None = None,
 ) -> OptimizationResult:
-    """Minimize variance subject to a target return constraint."""
-    assets = list(returns_df.columns)
-    n = len(assets)
-    mean_returns = _annualized_mean(returns_df)
-    cov = _annualized_cov(returns_df)
+    """
+    Minimize variance subject to a target return constraint.
 
-    constraints = (
-        {"type": "eq", "fun": lambda w: np.sum(w) - 1.0},
-        {"type": "eq", "fun": lambda w: float(w @ mean_returns.values) - target_return},
-    )
-    x0 = np.repeat(1.0 / n, n)
-    bnds = _as_bounds(bounds, n)
+    ``moments`` may carry precomputed :func:`annualized_moments` output.
+    """
+    assets = list(returns_df.columns)
+    mean_np, cov_np = moments if moments is not None else _cached_moments(returns_df)
 
-    result = minimize(
-        lambda w: w.T @ cov.values @ w,
-        x0,
-        bounds=bnds,
-        constraints=constraints,
-        method="SLSQP",
-        options=_SOLVER_OPTIONS,
-    )
-    if not result.success:
-        raise ValueError(f"Optimization failed: {result.message}")
+    bnds = _as_bounds(bounds, len(assets))
+    w = _target_return_core(mean_np, cov_np, target_return, bnds)
 
-    weights = dict(zip(assets, result.x))
-    expected_return = float(result.x @ mean_returns.values)
-    volatility = _portfolio_volatility(result.x, cov)
+    weights = dict(zip(assets, w))
+    expected_return = float(w @ mean_np)
+    volatility = _portfolio_volatility(w, cov_np)
     sharpe = expected_return / volatility if volatility > 0 else float("nan")
     return OptimizationResult(weights, expected_return, volatility, sharpe)
 
@@ -217,15 +566,26 @@ def efficient_frontier(
     returns_df: pd.DataFrame,
     num_points: int = 20,
     bounds: Iterable[tuple[float, float]] | None = None,
+    moments: Moments | None = None,
 ) -> pd.DataFrame:
-    """Compute a simple efficient frontier as (return, volatility) points."""
-    mean_returns = _annualized_mean(returns_df)
-    min_ret = float(mean_returns.min())
-    max_ret = float(mean_returns.max())
+    """
+    Compute a simple efficient frontier as (return, volatility) points.
+
+    Moments are computed once for all targets. The unbounded frontier is
+    solved analytically for every target at once; targets whose analytic
+    weights already satisfy the bounds use it directly. The rest are
+    solved numerically, each seeded with the previous point's weights:
+    neighbouring frontier portfolios are close, so the warm-started
+    solver converges in few iterations.
+    """
+    mean_np, cov_np = moments if moments is not None else _cached_moments(returns_df)
+    bnds = _as_bounds(bounds, len(mean_np))
+    min_ret = float(mean_np.min())
+    max_ret = float(mean_np.max())
 
     try:
-        min_ret = _min_expected_return(returns_df, bounds=bounds)
-        max_ret = _max_expected_return(returns_df, bounds=bounds)
+        min_ret = _min_expected_return(mean_np, bnds)
+        max_ret = _max_expected_return(mean_np, bnds)
     except ValueError as exc:
         logger.warning("Falling back to naive target range: %s", exc)
 
@@ -233,22 +593,33 @@ def efficient_frontier(
         min_ret, max_ret = max_ret, min_ret
 
     targets = np.linspace(min_ret, max_ret, num_points)
-    records = []
-    skipped = 0
-    for target in targets:
+    analytic = _analytic_frontier_weights(mean_np, cov_np, targets)
+    if analytic is not None:
+        lower, upper = _bound_arrays(bnds)
+        in_bounds = np.all((analytic >= lower) & (analytic <= upper), axis=1)
+    frontier_weights = np.full((num_points, len(mean_np)), np.nan)
+    x0 = None
+    for i, target in enumerate(targets):
         try:
-            result = target_return(returns_df, target, bounds=bounds)
-            records.append(
-                {
-                    "target_return": result.expected_return,
-                    "volatility": result.volatility,
-                }
-            )
+            if analytic is not None and in_bounds[i]:
+                w = analytic[i]
+            else:
+                w = _target_return_core(mean_np, cov_np, target, bnds, x0=x0)
         except ValueError as exc:
-            skipped += 1
             logger.debug("Skipping target %.6f: %s", target, exc)
+            continue
+        frontier_weights[i] = w
+        x0 = w
 
+    solved = ~np.isnan(frontier_weights).any(axis=1)
+    skipped = num_points - int(solved.sum())
     if skipped:
         logger.info("Efficient frontier: skipped %d/%d targets", skipped, num_points)
 
-    return pd.DataFrame(records, columns=["target_return", "volatility"])
+    frontier_weights = frontier_weights[solved]
+    out = np.empty((len(frontier_weights), 2))
+    out[:, 0] = frontier_weights @ mean_np
+    out[:, 1] = np.sqrt(
+        np.einsum("ij,jk,ik->i", frontier_weights, cov_np, frontier_weights)
+    )
+    return pd.DataFrame(out, columns=["target_return", "volatility"])
@@ -4,17 +4,31 @@ Output helpers for CSV/JSON exports.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pandas as pd
 
+try:  # Optional: orjson serializes in Rust and handles NumPy scalars.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 
 def _ensure_parent(path: Path) -> None:
     """Create parent directories for the given path if missing."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _dumps(obj: object) -> bytes:
+    """Serialize ``obj`` as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=options)
+    import json
+
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 def write_metrics_csv(metrics_df: pd.DataFrame, path: str | Path) -> Path:
     """
     Write metrics DataFrame to CSV.
@@ -31,8 +45,8 @@ def write_metrics_json(metrics_df: pd.DataFrame, path: str | Path) -> Path:
     """
     path = Path(path)
     _ensure_parent(path)
-    records = metrics_df.reset_index().to_dict(orient="records")
-    path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+    records_json = metrics_df.reset_index().to_json(orient="records", indent=2)
+    path.write_text(records_json, encoding="utf-8")
     return path
 
 
@@ -53,7 +67,7 @@ def write_allocation_json(weights: dict[str, float], path: str | Path) -> Path:
     """
     path = Path(path)
     _ensure_parent(path)
-    path.write_text(json.dumps(weights, indent=2), encoding="utf-8")
+    path.write_bytes(_dumps(weights))
     return path
 
 
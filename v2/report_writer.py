@@ -4,7 +4,9 @@ HTML report generation for V2 outputs.
 
 from __future__ import annotations
 
+import io
 from datetime import datetime, timezone
+from functools import lru_cache
 from html import escape
 from pathlib import Path
 from typing import Dict
@@ -13,18 +15,23 @@ import numpy as np
 import pandas as pd
 
 
-def _table_html(df: pd.DataFrame) -> str:
+def _table_html(
+    df: pd.DataFrame,
+    index: bool = True,
+    justify: str | None = "left",
+) -> str:
     """Return a minimal HTML table for a DataFrame."""
-    return df.to_html(border=0, classes="table", justify="left")
+    buf = io.StringIO()
+    df.to_html(buf=buf, index=index, border=0, classes="table", justify=justify)
+    return buf.getvalue()
 
 
 def _weights_df(weights: Dict[str, float]) -> pd.DataFrame:
     """Convert allocation weights to a DataFrame."""
-    return pd.DataFrame(
-        [{"asset": k, "weight": v} for k, v in weights.items()]
-    ).set_index("asset")
+    return pd.Series(weights, name="weight", dtype=float).rename_axis("asset").to_frame()
 
 
+@lru_cache(maxsize=256)
 def _format_percent(value: float | int | None, decimals: int = 2) -> str:
     """Format a numeric ratio as a percentage string."""
     if value is None or pd.isna(value):
@@ -32,6 +39,7 @@ def _format_percent(value: float | int | None, decimals: int = 2) -> str:
     return f"{float(value) * 100:.{decimals}f}%"
 
 
+@lru_cache(maxsize=256)
 def _format_ratio(value: float | int | None, decimals: int = 2) -> str:
     """Format a numeric ratio with fixed decimals."""
     if value is None or pd.isna(value):
@@ -152,11 +160,13 @@ def _describe_correlation(corr: pd.DataFrame) -> str:
     """Describe average correlation and diversification signal."""
     if corr.empty or corr.shape[0] < 2:
         return "Correlation needs at least two assets to interpret."
-    mask = ~np.eye(corr.shape[0], dtype=bool)
-    values = corr.where(mask).stack()
-    if values.empty:
+    values = corr.to_numpy(dtype=float)
+    # The matrix is symmetric, so the strict upper triangle holds every pair once.
+    off_diag = values[np.triu_indices_from(values, k=1)]
+    off_diag = off_diag[~np.isnan(off_diag)]
+    if off_diag.size == 0:
         return "Correlation metrics could not be computed for the assets."
-    mean_corr = float(values.mean())
+    mean_corr = float(off_diag.mean())
     if mean_corr >= 0.7:
         level = "high"
     elif mean_corr >= 0.4:
@@ -269,6 +279,13 @@ def write_html_report(
         "Confidence": params.get("confidence"),
     }
     summary_df = pd.DataFrame(list(summary.items()), columns=["param", "value"])
+    tables = {
+        "summary": _table_html(summary_df, index=False, justify=None),
+        "metrics": _table_html(metrics_df),
+        "weights": _table_html(weights_df),
+        "corr": _table_html(corr),
+        "frontier": _table_html(frontier),
+    }
     interpretation_items = [
         _describe_portfolio_summary(portfolio_return, portfolio_vol, portfolio_sharpe),
         _describe_volatility(metrics_df),
@@ -333,22 +350,22 @@ def write_html_report(
   </div>
 
   <h2>Run Parameters</h2>
-  {summary_df.to_html(index=False, border=0, classes="table")}
+  {tables["summary"]}
 
   <h2>Interpretation (auto-generated)</h2>
   {interpretation_html}
 
   <h2>Metrics (per asset)</h2>
-  {_table_html(metrics_df)}
+  {tables["metrics"]}
 
   <h2>Allocation</h2>
-  {_table_html(weights_df)}
+  {tables["weights"]}
 
   <h2>Correlation</h2>
-  {_table_html(corr)}
+  {tables["corr"]}
 
   <h2>Efficient Frontier</h2>
-  {_table_html(frontier)}
+  {tables["frontier"]}
 
   <h2>How to read the figures</h2>
   {figures_html}
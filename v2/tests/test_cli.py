@@ -11,7 +11,9 @@ from pathlib import Path
 
 import pandas as pd
 
+import data_fetcher
 import main as v2_main
+import visualizer
 from config import (
     AppConfig,
     Config,
@@ -27,7 +29,7 @@ class FakeClient:
     """Deterministic client stub for CLI tests."""
 
     def __init__(self, *args, **kwargs) -> None:
-        pass
+        self.settings_key = tuple(sorted(kwargs.items()))
 
     def get_current_price(self, symbol: str, vs_currency: str = "USD") -> float:
         """Return a fixed price by symbol."""
@@ -101,7 +103,7 @@ def test_cli_analyze_writes_outputs(monkeypatch, tmp_path: Path) -> None:
 
     monkeypatch.setattr(v2_main, "CryptoCompareClient", FakeClient)
     monkeypatch.setattr(v2_main, "load_config", lambda _: cfg)
-    monkeypatch.setattr(v2_main.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
 
     argv = [
         "main.py",
@@ -141,7 +143,7 @@ def test_cli_optimize_applies_bounds(monkeypatch, tmp_path: Path) -> None:
 
     monkeypatch.setattr(v2_main, "CryptoCompareClient", FakeClient)
     monkeypatch.setattr(v2_main, "load_config", lambda _: cfg)
-    monkeypatch.setattr(v2_main.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
     monkeypatch.setattr(v2_main, "max_sharpe", fake_max_sharpe)
 
     argv = [
@@ -180,8 +182,10 @@ def test_cli_visualize_writes_report(monkeypatch, tmp_path: Path) -> None:
 
     monkeypatch.setattr(v2_main, "CryptoCompareClient", FakeClient)
     monkeypatch.setattr(v2_main, "load_config", lambda _: cfg)
-    monkeypatch.setattr(v2_main.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
     monkeypatch.setattr(v2_main, "efficient_frontier", fake_frontier)
+    # The CLI enables the chart memo; restore the library default afterwards.
+    monkeypatch.setattr(visualizer, "_CHART_CACHE_DIR", None)
 
     argv = [
         "main.py",
@@ -202,3 +206,75 @@ def test_cli_visualize_writes_report(monkeypatch, tmp_path: Path) -> None:
     report_path = outdir / "report.html"
     assert report_path.exists()
     assert "Glossary" in report_path.read_text(encoding="utf-8")
+    assert any((tmp_path / "cache" / "charts").iterdir())
+    for name in ("risk_bars.png", "correlation_heatmap.png", "frontier.png"):
+        assert (outdir / name).exists()
+
+
+def test_load_market_data_reuses_previous_fetch(monkeypatch, tmp_path: Path) -> None:
+    """A second load in the same process should not hit the client again."""
+    portfolio_path = _write_portfolio(tmp_path)
+    calls: list[str] = []
+
+    class CountingClient(FakeClient):
+        def get_historical_daily(self, symbol, vs_currency="USD", days=30):
+            calls.append(symbol)
+            return super().get_historical_daily(symbol, vs_currency, days)
+
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(v2_main, "_MARKET_DATA_CACHE", {})
+    client = CountingClient()
+
+    portfolio, returns_df = v2_main.load_market_data(client, portfolio_path, 30)
+    assert len(calls) == 2
+
+    portfolio.assets.clear()
+    again, again_returns = v2_main.load_market_data(client, portfolio_path, 30)
+    assert len(calls) == 2
+    assert len(again.assets) == 2
+    pd.testing.assert_frame_equal(again_returns, returns_df)
+
+    v2_main.load_market_data(client, portfolio_path, 30, refresh=True)
+    assert len(calls) == 4
+
+
+def test_load_market_data_memo_is_per_client_and_bounded(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Clients with other settings refetch, and old entries are evicted."""
+    portfolio_path = _write_portfolio(tmp_path)
+    calls: list[str] = []
+
+    class CountingClient(FakeClient):
+        def get_historical_daily(self, symbol, vs_currency="USD", days=30):
+            calls.append(symbol)
+            return super().get_historical_daily(symbol, vs_currency, days)
+
+    monkeypatch.setattr(v2_main, "_MARKET_DATA_CACHE", {})
+    monkeypatch.setattr(v2_main, "_MARKET_DATA_CACHE_SIZE", 2)
+
+    first = CountingClient(cache_dir="a")
+    v2_main.load_market_data(first, portfolio_path, 30)
+    v2_main.load_market_data(CountingClient(cache_dir="b"), portfolio_path, 30)
+    assert len(calls) == 4
+
+    # A hit refreshes the first entry, so the third client evicts "b".
+    v2_main.load_market_data(first, portfolio_path, 30)
+    v2_main.load_market_data(CountingClient(cache_dir="c"), portfolio_path, 30)
+    assert len(calls) == 6
+    assert len(v2_main._MARKET_DATA_CACHE) == 2
+    v2_main.load_market_data(first, portfolio_path, 30)
+    assert len(calls) == 6
+
+
+def test_get_client_reuses_instance_per_cache_settings(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """Share one client per cache settings and build a new one otherwise."""
+    cfg = _make_config(tmp_path, _write_portfolio(tmp_path))
+    monkeypatch.setattr(v2_main, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(v2_main, "CryptoCompareClient", FakeClient)
+
+    first = v2_main.get_client(cfg, offline=False, refresh_cache=False)
+    assert v2_main.get_client(cfg, offline=False, refresh_cache=False) is first
+    assert v2_main.get_client(cfg, offline=True, refresh_cache=False) is not first
@@ -39,6 +39,7 @@ def test_load_config_uses_defaults_when_file_missing(tmp_path: Path) -> None:
     assert cfg.risk.days == 30
     assert cfg.risk.risk_free_rate == 0.02
     assert cfg.risk.confidence == 0.95
+    assert cfg.risk.use_log_returns is False
 
     assert cfg.optimization.target_return == 0.10
     assert cfg.optimization.max_weight_per_asset == 0.30
@@ -96,3 +97,34 @@ def test_load_config_invalid_yaml_raises_value_error(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError):
         load_config(cfg_path)
+
+
+def test_load_config_reuses_parsed_yaml_until_file_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Repeated loads of an unchanged file should parse the YAML only once,
+    while editing the file must be picked up on the next load.
+    """
+    import config
+
+    calls: list[Path] = []
+    original = config._load_yaml
+
+    def counting_load_yaml(path: Path) -> Dict[str, Any]:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(config, "_load_yaml", counting_load_yaml)
+
+    cfg_path = tmp_path / "cached_config.yml"
+    cfg_path.write_text("risk:\n  days: 10\n", encoding="utf-8")
+
+    assert load_config(cfg_path).risk.days == 10
+    assert load_config(cfg_path).risk.days == 10
+    assert len(calls) == 1
+
+    cfg_path.write_text("risk:\n  days: 120\n", encoding="utf-8")
+    assert load_config(cfg_path).risk.days == 120
+    assert len(calls) == 2
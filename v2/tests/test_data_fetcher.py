@@ -12,12 +12,12 @@ import pytest
 import pandas as pd
 
 import data_fetcher
-from data_fetcher import CryptoCompareClient
+from data_fetcher import CryptoCompareClient, TokenBucket
 from cache import save_series
 
 
 class DummyResponse:
-    """Simple response stub for requests.get."""
+    """Simple response stub for Session.get."""
 
     def __init__(self, payload: dict[str, Any], status_code: int = 200) -> None:
         self._payload = payload
@@ -33,12 +33,21 @@ class DummyResponse:
             raise RuntimeError("HTTP error")
 
 
+def _patch_session_get(monkeypatch: pytest.MonkeyPatch, fake_get) -> None:
+    """Route every client session GET through `fake_get`."""
+    monkeypatch.setattr(
+        data_fetcher.requests.Session,
+        "get",
+        lambda self, url, **kwargs: fake_get(url, **kwargs),
+    )
+
+
 def test_get_current_price_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Return the expected price from a successful API response."""
     def fake_get(url: str, params=None, headers=None, timeout=None) -> DummyResponse:
         return DummyResponse({"USD": 123.45})
 
-    monkeypatch.setattr(data_fetcher.requests, "get", fake_get)
+    _patch_session_get(monkeypatch, fake_get)
 
     client = CryptoCompareClient(timeout=1, max_retries=0)
     price = client.get_current_price("eth", "usd")
@@ -50,7 +59,7 @@ def test_get_raises_on_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_get(url: str, params=None, headers=None, timeout=None) -> DummyResponse:
         return DummyResponse({"Response": "Error", "Message": "Limit exceeded"})
 
-    monkeypatch.setattr(data_fetcher.requests, "get", fake_get)
+    _patch_session_get(monkeypatch, fake_get)
 
     client = CryptoCompareClient(timeout=1, max_retries=0)
     with pytest.raises(ValueError):
@@ -71,7 +80,7 @@ def test_get_historical_daily_returns_df(monkeypatch: pytest.MonkeyPatch) -> Non
     def fake_get(url: str, params=None, headers=None, timeout=None) -> DummyResponse:
         return DummyResponse(payload)
 
-    monkeypatch.setattr(data_fetcher.requests, "get", fake_get)
+    _patch_session_get(monkeypatch, fake_get)
 
     client = CryptoCompareClient(timeout=1, max_retries=0, cache_dir=None)
     df = client.get_historical_daily("eth", "usd", days=2)
@@ -95,7 +104,7 @@ def test_offline_uses_cached_history(tmp_path: Path, monkeypatch: pytest.MonkeyP
     def fail_get(*args, **kwargs):
         raise RuntimeError("network call not expected")
 
-    monkeypatch.setattr(data_fetcher.requests, "get", fail_get)
+    _patch_session_get(monkeypatch, fail_get)
 
     client = CryptoCompareClient(
         timeout=1,
@@ -146,7 +155,7 @@ def test_refresh_cache_bypasses_cached_data(
     def fake_get(url: str, params=None, headers=None, timeout=None) -> DummyResponse:
         return DummyResponse(payload)
 
-    monkeypatch.setattr(data_fetcher.requests, "get", fake_get)
+    _patch_session_get(monkeypatch, fake_get)
 
     client = CryptoCompareClient(
         timeout=1,
@@ -157,3 +166,58 @@ def test_refresh_cache_bypasses_cached_data(
     )
     df = client.get_historical_daily("ETH", "USD", days=2)
     assert df["price"].iloc[0] == 200.0
+
+
+def test_token_bucket_only_sleeps_when_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Allow a burst without waiting, then pace further requests."""
+    sleeps: list[float] = []
+    monkeypatch.setattr(data_fetcher.time, "monotonic", lambda: 0.0)
+    monkeypatch.setattr(data_fetcher.time, "sleep", sleeps.append)
+
+    bucket = TokenBucket(rate=2.0, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+
+    bucket.acquire()
+    assert sleeps == [0.5]
+
+
+def test_rate_limited_response_halves_bucket_rate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Slow the shared token bucket down when the API answers HTTP 429."""
+    def fake_get(url: str, params=None, headers=None, timeout=None) -> DummyResponse:
+        return DummyResponse({}, status_code=429)
+
+    _patch_session_get(monkeypatch, fake_get)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
+
+    bucket = TokenBucket(rate=2.0, burst=4)
+    client = CryptoCompareClient(timeout=1, max_retries=1, rate_limiter=bucket)
+    with pytest.raises(RuntimeError):
+        client.get_current_price("eth", "usd")
+
+    assert bucket.rate == 0.5
+
+
+def test_successful_responses_restore_bucket_rate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Recover the rate step by step once the API stops answering HTTP 429."""
+    statuses = [429] + [200] * 10
+
+    def fake_get(url: str, params=None, headers=None, timeout=None) -> DummyResponse:
+        return DummyResponse({"USD": 1.0}, status_code=statuses.pop(0))
+
+    _patch_session_get(monkeypatch, fake_get)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda *_: None)
+
+    bucket = TokenBucket(rate=2.0, burst=4)
+    client = CryptoCompareClient(timeout=1, max_retries=1, rate_limiter=bucket)
+    client.get_current_price("eth", "usd")
+    assert bucket.rate == 2.0 * TokenBucket.RECOVERY_FACTOR / 2
+
+    for _ in range(5):
+        client.get_current_price("eth", "usd")
+    assert bucket.rate == 2.0
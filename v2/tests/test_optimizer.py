@@ -4,8 +4,12 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
+import pytest
+from scipy.optimize import check_grad
 
+import optimizer
 from optimizer import (
+    annualized_moments,
     efficient_frontier,
     max_sharpe,
     min_variance,
@@ -56,3 +60,171 @@ def test_efficient_frontier_points() -> None:
     returns = _sample_returns()
     frontier = efficient_frontier(returns, num_points=5)
     assert {"target_return", "volatility"}.issubset(frontier.columns)
+
+
+def test_min_variance_closed_form_matches_numeric_solution() -> None:
+    """Interior min-variance weights match the analytic KKT solution."""
+    returns = _sample_returns()
+    cov = returns.cov().to_numpy() * 365
+    inv_ones = np.linalg.solve(cov, np.ones(2))
+    expected = inv_ones / inv_ones.sum()
+
+    result = min_variance(returns)
+
+    assert np.allclose(list(result.weights.values()), expected)
+    assert np.isclose(result.volatility, np.sqrt(expected @ cov @ expected))
+
+
+def test_min_variance_respects_binding_bounds() -> None:
+    """Fall back to the bounded solver when the analytic weights violate bounds."""
+    returns = _sample_returns()
+    result = min_variance(returns, bounds=[(0.0, 0.6), (0.0, 0.6)])
+    assert all(w <= 0.6 + 1e-6 for w in result.weights.values())
+    assert np.isclose(sum(result.weights.values()), 1.0, atol=1e-6)
+
+
+def test_efficient_frontier_spans_feasible_returns() -> None:
+    """Frontier endpoints reach the lowest and highest asset mean returns."""
+    returns = _sample_returns()
+    mean_returns = returns.mean() * 365
+    frontier = efficient_frontier(returns, num_points=5)
+    assert np.isclose(frontier["target_return"].min(), mean_returns.min(), atol=1e-6)
+    assert np.isclose(frontier["target_return"].max(), mean_returns.max(), atol=1e-6)
+
+
+def test_precomputed_moments_match_default_path() -> None:
+    """Passing annualized moments gives the same result as recomputing them."""
+    returns = _sample_returns()
+    moments = annualized_moments(returns)
+    assert np.allclose(moments[0], returns.mean() * 365)
+    assert np.allclose(moments[1], returns.cov() * 365)
+
+    direct = max_sharpe(returns, risk_free_rate=0.0)
+    reused = max_sharpe(returns, risk_free_rate=0.0, moments=moments)
+    assert direct == reused
+
+
+def test_moments_skip_nan_gaps_like_pandas() -> None:
+    """Returns with a NaN gap use pandas' NaN-skipping mean and covariance."""
+    rng = np.random.default_rng(3)
+    returns = pd.DataFrame(
+        rng.normal(0.001, 0.02, size=(100, 3)), columns=["A", "B", "C"]
+    )
+    returns.iloc[10, 1] = np.nan
+
+    mean_np, cov_np = annualized_moments(returns)
+    np.testing.assert_allclose(mean_np, returns.mean() * 365)
+    np.testing.assert_allclose(cov_np, returns.cov() * 365)
+
+    result = min_variance(returns)
+    assert np.isfinite(result.volatility)
+    assert np.isclose(sum(result.weights.values()), 1.0)
+    _, shrunk = annualized_moments(returns, cov_estimator="ledoit_wolf")
+    assert np.isfinite(shrunk).all()
+
+
+def test_objective_gradients_match_finite_differences() -> None:
+    """Analytic objective gradients agree with numerical differentiation."""
+    mean_np, cov_np = annualized_moments(_sample_returns())
+    w = np.array([0.3, 0.7])
+
+    def fun(x: np.ndarray, index: int) -> float:
+        return optimizer._neg_sharpe_and_grad(x, mean_np, cov_np, 0.01)[index]
+
+    assert check_grad(lambda x: fun(x, 0), lambda x: fun(x, 1), w) < 1e-5
+    assert check_grad(
+        lambda x: optimizer._variance_and_grad(x, cov_np)[0],
+        lambda x: optimizer._variance_and_grad(x, cov_np)[1],
+        w,
+    ) < 1e-5
+
+
+def test_moments_are_cached_per_returns_frame() -> None:
+    """Reuse moments for the same frame and recompute for a new one."""
+    returns = _sample_returns()
+    first = optimizer._cached_moments(returns)
+    assert optimizer._cached_moments(returns) is first
+    assert optimizer._cached_moments(returns.copy()) is not first
+
+
+def test_moments_cache_sees_in_place_edits() -> None:
+    """Recompute moments after the frame is mutated or the cache cleared."""
+    returns = _sample_returns()
+    first = optimizer._cached_moments(returns)
+    returns *= 2
+    second = optimizer._cached_moments(returns)
+    assert second is not first
+    np.testing.assert_allclose(second[1], annualized_moments(returns)[1])
+    returns.iloc[0, 0] = 0.05
+    fresh = min_variance(returns.copy()).weights
+    assert min_variance(returns).weights == pytest.approx(fresh)
+    optimizer.clear_moments_cache()
+    assert optimizer._cached_moments(returns) is not second
+
+
+def test_max_sharpe_matches_grid_search() -> None:
+    """The convex max-Sharpe solve finds the best ratio on a fine grid."""
+    returns = _sample_returns()
+    mean_np, cov_np = annualized_moments(returns)
+    grid = np.linspace(0.0, 1.0, 10001)
+    weights = np.column_stack([grid, 1.0 - grid])
+    ratios = (weights @ mean_np) / np.sqrt(
+        np.einsum("ij,jk,ik->i", weights, cov_np, weights)
+    )
+
+    result = max_sharpe(returns, risk_free_rate=0.0)
+
+    assert result.sharpe >= ratios.max() - 1e-6
+
+
+def test_efficient_frontier_analytic_points_match_solver() -> None:
+    """Frontier points from the batched closed form match per-target solves."""
+    returns = _sample_returns()
+    bounds = [(-5.0, 5.0), (-5.0, 5.0)]
+    frontier = efficient_frontier(returns, num_points=5, bounds=bounds)
+
+    for row in frontier.itertuples(index=False):
+        solved = target_return(returns, row.target_return, bounds=bounds)
+        assert np.isclose(row.volatility, solved.volatility, atol=1e-6)
+
+
+def test_ledoit_wolf_moments_shrink_towards_identity() -> None:
+    """Shrinkage keeps total variance but improves the condition number."""
+    rng = np.random.default_rng(0)
+    returns = pd.DataFrame(rng.normal(size=(30, 6)) @ rng.normal(size=(6, 6)))
+    n_obs = len(returns)
+
+    _, sample = annualized_moments(returns)
+    _, shrunk = annualized_moments(returns, cov_estimator="ledoit_wolf")
+
+    # Ledoit-Wolf uses the 1/n empirical covariance as its starting point.
+    assert np.isclose(np.trace(shrunk), np.trace(sample) * (n_obs - 1) / n_obs)
+    assert np.allclose(shrunk, shrunk.T)
+    assert np.linalg.cond(shrunk) < np.linalg.cond(sample)
+
+
+def test_annualized_moments_rejects_unknown_estimator() -> None:
+    """Raise ValueError for unsupported covariance estimators."""
+    with pytest.raises(ValueError):
+        annualized_moments(_sample_returns(), cov_estimator="oracle")
+
+
+def test_float32_moments_give_matching_frontier() -> None:
+    """Single-precision moments reproduce the double-precision frontier."""
+    returns = _sample_returns()
+    moments32 = annualized_moments(returns, dtype=np.float32)
+    assert all(arr.dtype == np.float32 for arr in moments32)
+
+    frontier64 = efficient_frontier(returns, num_points=5)
+    frontier32 = efficient_frontier(returns, num_points=5, moments=moments32)
+    assert np.allclose(frontier32.to_numpy(), frontier64.to_numpy(), rtol=1e-4)
+
+
+def test_cholesky_factor_is_shared_for_cached_moments() -> None:
+    """Solves on cached (read-only) covariance reuse one factorization."""
+    _, cov_np = optimizer._cached_moments(_sample_returns())
+    factor = optimizer._cholesky_factor(cov_np)
+
+    assert optimizer._cholesky_factor(cov_np) is factor
+    assert np.allclose(factor @ factor.T, cov_np)
+    assert np.allclose(cov_np @ optimizer._cov_solve(cov_np, np.ones(2)), 1.0)
@@ -1,19 +1,52 @@
 """Tests for risk_analyzer module."""
 
+import sys
+
 import numpy as np
 import pandas as pd
 import pytest
 
+import risk_analyzer
 from risk_analyzer import (
+    align_weights,
     prices_to_returns,
+    prices_to_log_returns,
     annualized_volatility,
+    annualized_volatility_all,
     sharpe_ratio,
+    sharpe_ratio_all,
     historical_var,
+    HistoricalVaR,
     correlation_matrix,
+    clear_covariance_cache,
+    covariance_matrix,
     portfolio_volatility,
+    prices_to_covariance,
+    to_view,
+    column_moments,
+    column_quantiles,
+    compute_risk_bundle,
+    risk_metrics,
 )
 
 
+class TestReturnsView:
+    """Tests for the ReturnsView conversion."""
+
+    def test_view_is_contiguous_read_only_float64(self):
+        """Test the layout and completeness flag of the converted view."""
+        returns = pd.DataFrame({"ETH": [0.01, -0.02], "BTC": [1, 2]})
+        view = to_view(returns)
+        assert view.arr.dtype == np.float64
+        assert view.arr.flags.c_contiguous
+        assert not view.arr.flags.writeable
+        assert view.columns == ("ETH", "BTC")
+        assert view.complete
+
+        returns.iloc[0, 0] = np.nan
+        assert not to_view(returns).complete
+
+
 class TestPricesToReturns:
     """Tests for prices_to_returns function."""
 
@@ -31,6 +64,47 @@ class TestPricesToReturns:
         assert "ETH" in returns.columns
         assert "BTC" in returns.columns
 
+    def test_matches_pct_change_with_gaps(self):
+        """Test parity with pandas pct_change, including gaps and zeros."""
+        prices = pd.DataFrame(
+            {
+                "ETH": [100.0, np.nan, 110.0, 0.0, 120.0],
+                "BTC": [50.0, np.nan, 51.0, 52.0, np.nan],
+            }
+        )
+        expected = prices.pct_change().dropna(how="all")
+        pd.testing.assert_frame_equal(prices_to_returns(prices), expected)
+
+
+class TestPricesToLogReturns:
+    """Tests for prices_to_log_returns function."""
+
+    def test_log_returns(self):
+        """Test log return calculation without a leading NaN row."""
+        prices = pd.DataFrame({"ETH": [100, 110, 99]})
+        returns = prices_to_log_returns(prices)
+        assert len(returns) == 2
+        assert not returns.isna().any().any()
+        assert abs(returns["ETH"].iloc[0] - np.log(1.10)) < 1e-12
+        assert list(returns.index) == [1, 2]
+
+    @pytest.mark.filterwarnings("error::RuntimeWarning")
+    def test_zero_price_and_gaps_without_warnings(self):
+        """Test zero ticks give infinities quietly and all-NaN rows are dropped."""
+        prices = pd.DataFrame(
+            {
+                "ETH": [100.0, np.nan, 110.0, 0.0, 120.0],
+                "BTC": [50.0, np.nan, 51.0, 52.0, np.nan],
+            }
+        )
+        returns = prices_to_log_returns(prices)
+
+        with np.errstate(divide="ignore"):
+            expected = np.log(prices / prices.shift(1)).dropna(how="all")
+        pd.testing.assert_frame_equal(returns, expected)
+        assert returns["ETH"].loc[3] == -np.inf
+        assert returns["ETH"].loc[4] == np.inf
+
 
 class TestAnnualizedVolatility:
     """Tests for annualized_volatility function."""
@@ -53,6 +127,26 @@ class TestAnnualizedVolatility:
         vol = annualized_volatility(returns)
         assert np.isnan(vol)
 
+    def test_invalid_inputs_raise(self):
+        """Test that bad inputs raise even when asserts are stripped."""
+        with pytest.raises(TypeError):
+            annualized_volatility([0.01, 0.02])
+        with pytest.raises(ValueError):
+            annualized_volatility(pd.Series([0.01, 0.02]), periods_per_year=0)
+
+    def test_batch_matches_per_series(self):
+        """Test the batch form against per-column calls, with gaps."""
+        returns = pd.DataFrame({
+            "ETH": [0.01, -0.02, np.nan, 0.015, -0.01],
+            "BTC": [0.02, -0.01, 0.01, 0.0, 0.005],
+            "SOL": [np.nan, np.nan, np.nan, 0.03, np.nan],
+        })
+        vols = annualized_volatility_all(returns)
+        for i, col in enumerate(returns.columns):
+            np.testing.assert_allclose(
+                vols[i], returns[col].dropna().std() * np.sqrt(365), rtol=1e-12
+            )
+
 
 class TestSharpeRatio:
     """Tests for sharpe_ratio function."""
@@ -69,6 +163,20 @@ class TestSharpeRatio:
         sr = sharpe_ratio(returns)
         assert np.isnan(sr)
 
+    def test_batch_matches_per_series(self):
+        """Test the batch form against pandas reductions."""
+        returns = pd.DataFrame({
+            "ETH": [0.01, -0.02, 0.015, -0.01, 0.03],
+            "BTC": [0.02, -0.01, 0.01, 0.0, 0.005],
+            "USDC": [0.0, 0.0, 0.0, 0.0, 0.0],
+        })
+        sharpes = sharpe_ratio_all(returns, risk_free_rate=0.03)
+        excess = returns - 0.03 / 365
+        expected = excess.mean() / excess.std() * np.sqrt(365)
+        np.testing.assert_allclose(sharpes[:2], expected.iloc[:2], rtol=1e-12)
+        assert np.isnan(sharpes[2])
+        assert sharpe_ratio(returns["ETH"], risk_free_rate=0.03) == sharpes[0]
+
 
 class TestHistoricalVar:
     """Tests for historical_var function."""
@@ -86,6 +194,23 @@ class TestHistoricalVar:
         assert np.isnan(var)
 
 
+class TestHistoricalVaRClass:
+    """Tests for the multi-confidence HistoricalVaR helper."""
+
+    def test_matches_historical_var_at_each_level(self):
+        """Test that lookups on the sorted series equal the function."""
+        rng = np.random.default_rng(8)
+        returns = pd.Series(rng.normal(0, 0.02, 250))
+        returns.iloc[10] = np.nan
+        var = HistoricalVaR(returns)
+        for confidence in (0.9, 0.95, 0.99):
+            assert var.at(confidence) == historical_var(returns, confidence)
+
+    def test_empty_series_is_nan(self):
+        """Test that an all-NaN series gives NaN."""
+        assert np.isnan(HistoricalVaR(pd.Series([np.nan])).at(0.95))
+
+
 class TestCorrelationMatrix:
     """Tests for correlation_matrix function."""
 
@@ -108,6 +233,111 @@ class TestCorrelationMatrix:
         corr = correlation_matrix(returns)
         assert corr.loc["ETH", "BTC"] == corr.loc["BTC", "ETH"]
 
+    def test_matches_pandas_with_constant_column(self):
+        """Test parity with DataFrame.corr, including an undefined column."""
+        rng = np.random.default_rng(5)
+        returns = pd.DataFrame(rng.normal(0, 0.02, (120, 3)), columns=list("ABC"))
+        returns["D"] = 0.01
+        pd.testing.assert_frame_equal(correlation_matrix(returns), returns.corr())
+
+
+class TestCovarianceMatrix:
+    """Tests for covariance_matrix function."""
+
+    def test_matches_pandas(self):
+        """Test parity with DataFrame.cov, with and without gaps."""
+        rng = np.random.default_rng(3)
+        returns = pd.DataFrame(rng.normal(0, 0.02, (200, 4)), columns=list("ABCD"))
+        pd.testing.assert_frame_equal(
+            covariance_matrix(returns), returns.cov(), rtol=1e-12, atol=1e-15
+        )
+
+        gappy = returns.copy()
+        gappy.iloc[5, 1] = np.nan
+        pd.testing.assert_frame_equal(covariance_matrix(gappy), gappy.cov())
+
+    def test_gram_paths_agree(self, monkeypatch):
+        """Test that the NumPy fallback matches scipy's syrk wrapper."""
+        import scipy.linalg  # noqa: F401  (make sure the syrk path is taken)
+
+        arr = np.random.default_rng(10).normal(size=(60, 5))
+        via_syrk = risk_analyzer._scaled_gram(arr, 0.5)
+        monkeypatch.delitem(sys.modules, "scipy.linalg")
+        via_numpy = risk_analyzer._scaled_gram(arr, 0.5)
+        np.testing.assert_allclose(via_numpy, via_syrk, rtol=1e-12)
+        np.testing.assert_array_equal(via_numpy, via_numpy.T)
+
+    def test_covariance_is_memoized_per_frame(self):
+        """Test that repeated calls reuse the cached covariance."""
+        returns = pd.DataFrame(np.eye(3) * 0.01, columns=list("ABC"))
+        first = risk_analyzer._cached_covariance(returns)
+        assert risk_analyzer._cached_covariance(returns) is first
+        assert not first.flags.writeable
+
+        # The returned frame is a private copy, safe to modify.
+        cov = covariance_matrix(returns)
+        cov.iloc[0, 0] = 1.0
+        assert first[0, 0] != 1.0
+
+        clear_covariance_cache()
+        assert risk_analyzer._cached_covariance(returns) is not first
+
+    def test_in_place_edits_are_recomputed(self):
+        """Test that a frame mutated in place does not serve stale results."""
+        returns = pd.DataFrame(np.eye(3) * 0.01, columns=list("ABC"))
+        covariance_matrix(returns)
+        returns *= 2
+        pd.testing.assert_frame_equal(covariance_matrix(returns), returns.cov())
+
+        returns.iloc[0, 1] = 0.05
+        pd.testing.assert_frame_equal(covariance_matrix(returns), returns.cov())
+        w = {"A": 0.5, "B": 0.3, "C": 0.2}
+        assert portfolio_volatility(returns, w) == pytest.approx(
+            portfolio_volatility(returns.copy(), w)
+        )
+
+
+class TestSinglePrecision:
+    """Tests for the float32 option of the matrix functions."""
+
+    def test_float32_matches_float64(self):
+        """Test that single-precision results stay close to double."""
+        rng = np.random.default_rng(7)
+        returns = pd.DataFrame(rng.normal(0, 0.02, (300, 4)), columns=list("ABCD"))
+        weights = {"A": 0.1, "B": 0.2, "C": 0.3, "D": 0.4}
+
+        cov32 = covariance_matrix(returns, dtype=np.float32)
+        corr32 = correlation_matrix(returns, dtype=np.float32)
+        assert cov32.dtypes.eq(np.float32).all()
+        assert corr32.dtypes.eq(np.float32).all()
+        np.testing.assert_allclose(cov32, covariance_matrix(returns), rtol=1e-4)
+        np.testing.assert_allclose(corr32, correlation_matrix(returns), atol=1e-5)
+
+        vol32 = portfolio_volatility(returns, weights, dtype=np.float32)
+        assert isinstance(vol32, float)
+        assert vol32 == pytest.approx(portfolio_volatility(returns, weights), rel=1e-5)
+
+
+class TestPricesToCovariance:
+    """Tests for prices_to_covariance function."""
+
+    def test_matches_two_step_pipeline(self):
+        """Test parity with prices_to_returns followed by DataFrame.cov."""
+        rng = np.random.default_rng(9)
+        prices = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(0, 0.02, (120, 3)), axis=0),
+            columns=list("ABC"),
+        )
+        expected = prices_to_returns(prices).cov()
+        pd.testing.assert_frame_equal(
+            prices_to_covariance(prices), expected, rtol=1e-12, atol=1e-15
+        )
+
+        prices.iloc[7, 2] = np.nan
+        pd.testing.assert_frame_equal(
+            prices_to_covariance(prices), prices_to_returns(prices).cov()
+        )
+
 
 class TestPortfolioVolatility:
     """Tests for portfolio_volatility function."""
@@ -121,3 +351,135 @@ class TestPortfolioVolatility:
         weights = {"ETH": 0.5, "BTC": 0.5}
         vol = portfolio_volatility(returns, weights)
         assert vol > 0
+
+    def test_align_weights_follows_column_order(self):
+        """Test that the weight mapping is ordered like the columns."""
+        w = align_weights({"BTC": 0.7, "ETH": 0.3}, ["ETH", "BTC"])
+        np.testing.assert_array_equal(w, [0.3, 0.7])
+
+    def test_missing_weight_raises_value_error(self):
+        """Test that an uncovered asset is reported as a ValueError."""
+        returns = pd.DataFrame({"ETH": [0.01, -0.02], "BTC": [0.02, -0.01]})
+        with pytest.raises(ValueError, match="BTC"):
+            portfolio_volatility(returns, {"ETH": 1.0})
+
+    def test_matches_covariance_quadratic_form(self):
+        """Test that the fused path equals sqrt(w' C w * periods)."""
+        rng = np.random.default_rng(4)
+        returns = pd.DataFrame(rng.normal(0, 0.02, (150, 3)), columns=list("ABC"))
+        weights = {"A": 0.2, "B": 0.3, "C": 0.5}
+        w = np.array([0.2, 0.3, 0.5])
+        expected = np.sqrt(w @ returns.cov().values @ w * 365)
+        assert portfolio_volatility(returns, weights) == pytest.approx(expected)
+
+
+class TestColumnMoments:
+    """Tests for column_moments function."""
+
+    def test_matches_numpy_mean_and_std(self):
+        """Test that fused moments match NumPy's separate reductions."""
+        arr = np.array([[0.01, 0.02], [-0.02, 0.01], [0.015, -0.005]])
+        mean, std = column_moments(arr)
+        np.testing.assert_allclose(mean, arr.mean(axis=0))
+        np.testing.assert_allclose(std, arr.std(axis=0, ddof=1))
+
+    def test_single_row_std_is_nan(self):
+        """Test that fewer than 2 rows gives NaN standard deviation."""
+        _, std = column_moments(np.array([[0.01, 0.02]]))
+        assert np.isnan(std).all()
+
+    def test_blocked_path_matches_numpy(self):
+        """Test that tall inputs merged block by block match NumPy."""
+        rng = np.random.default_rng(6)
+        rows = risk_analyzer._MOMENT_BLOCK_ROWS * 2 + 17
+        arr = rng.normal(0.001, 0.02, (rows, 3))
+        mean, std = column_moments(arr)
+        np.testing.assert_allclose(mean, arr.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(std, arr.std(axis=0, ddof=1), rtol=1e-12)
+
+
+class TestColumnQuantiles:
+    """Tests for column_quantiles function."""
+
+    @pytest.mark.parametrize("q", [0.0, 0.05, 0.5, 0.99, 1.0])
+    def test_matches_numpy_quantile(self, q):
+        """Test that partition-based quantiles match np.quantile exactly."""
+        arr = np.random.default_rng(0).normal(size=(31, 3))
+        np.testing.assert_array_equal(
+            column_quantiles(arr, q),
+            np.quantile(arr, q, axis=0),
+        )
+
+
+class TestComputeRiskBundle:
+    """Tests for compute_risk_bundle function."""
+
+    def test_matches_individual_metrics(self):
+        """Test that the fused bundle agrees with the standalone helpers."""
+        returns = pd.DataFrame(
+            {
+                "ETH": [0.01, -0.02, 0.015, 0.03, -0.01],
+                "BTC": [0.02, -0.01, 0.01, 0.005, -0.004],
+            }
+        )
+        weights = {"ETH": 0.4, "BTC": 0.6}
+
+        bundle = compute_risk_bundle(returns, weights, rf=0.02, confidence=0.95)
+
+        pd.testing.assert_frame_equal(
+            bundle.metrics, risk_metrics(returns, 0.02, 0.95)
+        )
+        pd.testing.assert_frame_equal(bundle.correlation, correlation_matrix(returns))
+        assert np.isclose(
+            bundle.portfolio_volatility,
+            portfolio_volatility(returns, weights),
+        )
+        np.testing.assert_allclose(bundle.covariance, covariance_matrix(returns))
+
+    def test_handles_gaps(self):
+        """Test that returns with a NaN gap use the pairwise-complete kernels."""
+        returns = pd.DataFrame(
+            {
+                "ETH": [0.01, -0.02, np.nan, 0.03, -0.01, 0.02],
+                "BTC": [0.02, -0.01, 0.01, 0.005, -0.004, 0.0],
+            }
+        )
+        weights = {"ETH": 0.4, "BTC": 0.6}
+
+        bundle = compute_risk_bundle(returns, weights, rf=0.02, confidence=0.95)
+
+        np.testing.assert_allclose(bundle.covariance, covariance_matrix(returns))
+        pd.testing.assert_frame_equal(bundle.correlation, correlation_matrix(returns))
+        assert np.isclose(
+            bundle.portfolio_volatility,
+            portfolio_volatility(returns, weights),
+        )
+        assert not bundle.metrics.isna().any().any()
+        np.testing.assert_allclose(bundle.mean_returns, returns.mean().to_numpy())
+
+    def test_mutated_frame_is_recomputed(self):
+        """Test that a bundle after an in-place edit matches a fresh frame."""
+        returns = pd.DataFrame(
+            {
+                "ETH": [0.01, -0.02, 0.015, 0.03, -0.01],
+                "BTC": [0.02, -0.01, 0.01, 0.005, -0.004],
+            }
+        )
+        weights = {"ETH": 0.4, "BTC": 0.6}
+        compute_risk_bundle(returns, weights, rf=0.02, confidence=0.95)
+        returns *= 3
+        returns.iloc[0, 1] = -0.05
+
+        bundle = compute_risk_bundle(returns, weights, rf=0.02, confidence=0.95)
+        fresh = compute_risk_bundle(
+            returns.copy(), weights, rf=0.02, confidence=0.95
+        )
+        np.testing.assert_array_equal(bundle.covariance, fresh.covariance)
+        assert bundle.portfolio_volatility == fresh.portfolio_volatility
+        pd.testing.assert_frame_equal(bundle.metrics, fresh.metrics)
+
+    def test_rejects_single_row(self):
+        """Test that fewer than 2 observations raise ValueError."""
+        returns = pd.DataFrame({"ETH": [0.01], "BTC": [0.02]})
+        with pytest.raises(ValueError, match="Not enough data"):
+            compute_risk_bundle(returns, {"ETH": 0.5, "BTC": 0.5}, 0.02, 0.95)
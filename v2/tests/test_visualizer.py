@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
+from xml.etree import ElementTree
 
+import numpy as np
 import pandas as pd
+import pytest
 
+import visualizer
 from visualizer import (
+    plot_all,
     plot_allocation_pie,
     plot_correlation_heatmap,
     plot_efficient_frontier,
@@ -14,6 +21,12 @@ from visualizer import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_png_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Exercise the opt-in PNG memo in a per-test directory."""
+    monkeypatch.setattr(visualizer, "_CHART_CACHE_DIR", tmp_path / "png-cache")
+
+
 def test_plot_risk_bars(tmp_path: Path) -> None:
     """Ensure risk bar plot saves to disk."""
     metrics = pd.DataFrame(
@@ -42,6 +55,37 @@ def test_plot_allocation_pie(tmp_path: Path) -> None:
     assert out.exists()
 
 
+def test_plot_allocation_pie_svg(tmp_path: Path) -> None:
+    """Ensure an .svg path yields one wedge per weight and escaped labels."""
+    weights = {"ETH": 0.5, "BTC": 0.3, "S&P": 0.2}
+    out = plot_allocation_pie(weights, tmp_path / "allocation.svg")
+
+    root = ElementTree.parse(out).getroot()
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    texts = [node.text for node in root.iterfind("svg:text", ns)]
+    assert len(root.findall("svg:path", ns)) == 3
+    assert {"ETH", "BTC", "S&P", "50.0%", "30.0%", "20.0%"} <= set(texts)
+
+
+def test_plot_allocation_pie_skips_zero_weights_largest_first(tmp_path: Path) -> None:
+    """Ensure zero-weight assets are dropped and wedges are ordered by size."""
+    weights = {"ETH": 0.2, "BTC": 0.0, "SOL": 0.8}
+    out = plot_allocation_pie(weights, tmp_path / "allocation.svg")
+
+    root = ElementTree.parse(out).getroot()
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    texts = [node.text for node in root.iterfind("svg:text", ns)]
+    assert len(root.findall("svg:path", ns)) == 2
+    assert "BTC" not in texts
+    assert texts.index("SOL") < texts.index("ETH")
+
+
+def test_plot_allocation_pie_svg_rejects_negative_weights(tmp_path: Path) -> None:
+    """Ensure the SVG pie refuses weights it cannot draw as wedges."""
+    with pytest.raises(ValueError, match="non-negative"):
+        plot_allocation_pie({"ETH": 1.2, "BTC": -0.2}, tmp_path / "a.svg")
+
+
 def test_plot_efficient_frontier(tmp_path: Path) -> None:
     """Ensure efficient frontier plot saves to disk."""
     frontier = pd.DataFrame(
@@ -49,3 +93,182 @@ def test_plot_efficient_frontier(tmp_path: Path) -> None:
     )
     out = plot_efficient_frontier(frontier, tmp_path / "frontier.png")
     assert out.exists()
+
+
+def test_lttb_keeps_endpoints_and_spikes() -> None:
+    """Ensure LTTB downsampling keeps the ends and a one-point outlier."""
+    x = np.linspace(0.0, 1.0, 2_000)
+    y = np.sin(6 * x)
+    y[1_234] = 5.0
+    keep = visualizer._lttb_indices(x, y, 100)
+
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 1_234 in keep
+    short = visualizer._lttb_indices(x[:50], y[:50], 100)
+    np.testing.assert_array_equal(short, np.arange(50))
+
+
+def test_plot_efficient_frontier_downsamples_long_frontiers(tmp_path: Path) -> None:
+    """Ensure a long frontier is drawn with at most the point budget."""
+    ret = np.linspace(0.0, 0.5, 5_000)
+    frontier = pd.DataFrame({"target_return": ret, "volatility": 0.2 + ret**2})
+    out = plot_efficient_frontier(frontier, tmp_path / "frontier.png")
+    line = visualizer._FIG_CACHE[("efficient_frontier", (6, 5))].axes[0].lines[0]
+
+    assert out.exists()
+    assert len(line.get_xdata()) == visualizer._FRONTIER_MAX_POINTS
+
+
+def test_repeated_plots_reuse_cached_figure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure redrawing a chart reuses its figure and gives the same image."""
+    monkeypatch.setattr(visualizer, "_CHART_CACHE_DIR", None)
+    corr = pd.DataFrame(
+        [[1.0, -0.4], [-0.4, 1.0]],
+        index=["ETH", "BTC"],
+        columns=["ETH", "BTC"],
+    )
+    first = plot_correlation_heatmap(corr, tmp_path / "a.png")
+    fig = visualizer._FIG_CACHE[("correlation_heatmap", (6, 5))]
+    second = plot_correlation_heatmap(corr, tmp_path / "b.png")
+
+    assert visualizer._FIG_CACHE[("correlation_heatmap", (6, 5))] is fig
+    assert len(fig.axes) == 2  # heatmap + colorbar, not accumulated
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_unchanged_inputs_reuse_memoized_png(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure a rerun over the same data copies the PNG instead of drawing."""
+    metrics = pd.DataFrame(
+        {"vol_ann": [0.2, 0.3], "sharpe": [0.5, 0.8]},
+        index=["ETH", "BTC"],
+    )
+    first = plot_risk_bars(metrics, tmp_path / "a.png")
+
+    def no_drawing(*args, **kwargs):
+        raise AssertionError("chart was redrawn")
+
+    monkeypatch.setattr(visualizer, "_cached_figure", no_drawing)
+    second = plot_risk_bars(metrics, tmp_path / "b.png")
+    assert first.read_bytes() == second.read_bytes()
+
+    changed = metrics.assign(sharpe=[0.5, 0.9])
+    with pytest.raises(AssertionError, match="redrawn"):
+        plot_risk_bars(changed, tmp_path / "c.png")
+
+
+def test_removed_directories_are_recreated(tmp_path: Path) -> None:
+    """Ensure deleting the output and memo directories between calls is safe."""
+    metrics = pd.DataFrame(
+        {"vol_ann": [0.2, 0.3], "sharpe": [0.5, 0.8]},
+        index=["ETH", "BTC"],
+    )
+    plot_risk_bars(metrics, tmp_path / "figures" / "a.png")
+    shutil.rmtree(tmp_path / "figures")
+    shutil.rmtree(tmp_path / "png-cache")
+
+    changed = metrics.assign(sharpe=[0.5, 0.9])
+    assert plot_risk_bars(changed, tmp_path / "figures" / "b.png").exists()
+    assert len(list((tmp_path / "png-cache").iterdir())) == 1
+
+
+def test_truncated_memo_is_redrawn(tmp_path: Path) -> None:
+    """Ensure a torn memo file is discarded instead of copied out."""
+    metrics = pd.DataFrame(
+        {"vol_ann": [0.2, 0.3], "sharpe": [0.5, 0.8]},
+        index=["ETH", "BTC"],
+    )
+    first = plot_risk_bars(metrics, tmp_path / "a.png").read_bytes()
+    (entry,) = (tmp_path / "png-cache").iterdir()
+    entry.write_bytes(first[: len(first) // 2])
+
+    second = plot_risk_bars(metrics, tmp_path / "b.png")
+    assert second.read_bytes() == first
+    assert entry.read_bytes() == first
+
+
+def test_chart_memo_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure the memo stays under its entry cap, dropping the oldest charts."""
+    monkeypatch.setattr(visualizer, "_CHART_CACHE_MAX_ENTRIES", 2)
+    cache_dir = tmp_path / "png-cache"
+    cache_dir.mkdir()
+    for age, name in enumerate(["newer", "older"], start=1):
+        (cache_dir / name).write_bytes(b"stale")
+        os.utime(cache_dir / name, (1000 - age, 1000 - age))
+
+    frontier = pd.DataFrame({"target_return": [0.1, 0.12], "volatility": [0.2, 0.22]})
+    plot_efficient_frontier(frontier, tmp_path / "frontier.png")
+
+    remaining = {path.name for path in cache_dir.iterdir()}
+    assert len(remaining) == 2
+    assert "newer" in remaining and "older" not in remaining
+
+
+def test_dpi_sets_image_size(tmp_path: Path) -> None:
+    """Ensure the dpi argument scales the saved image and the default applies."""
+    from PIL import Image
+
+    frontier = pd.DataFrame({"target_return": [0.1, 0.12], "volatility": [0.2, 0.22]})
+    default = plot_efficient_frontier(frontier, tmp_path / "default.png")
+    small = plot_efficient_frontier(frontier, tmp_path / "small.png", dpi=50)
+
+    with Image.open(default) as image:
+        assert image.size == (6 * visualizer.DEFAULT_DPI, 5 * visualizer.DEFAULT_DPI)
+    with Image.open(small) as image:
+        assert image.size == (300, 250)
+
+
+def test_webp_suffix_writes_webp(tmp_path: Path) -> None:
+    """Ensure a .webp path is encoded as WebP and memoized separately."""
+    from PIL import Image
+
+    frontier = pd.DataFrame({"target_return": [0.1, 0.12], "volatility": [0.2, 0.22]})
+    png = plot_efficient_frontier(frontier, tmp_path / "frontier.png")
+    webp = plot_efficient_frontier(frontier, tmp_path / "frontier.webp")
+
+    with Image.open(png) as image:
+        assert image.format == "PNG"
+    with Image.open(webp) as image:
+        assert image.format == "WEBP"
+
+
+def test_quantize_writes_palette_png(tmp_path: Path) -> None:
+    """Ensure quantized charts are palette PNGs and opting out keeps RGBA."""
+    from PIL import Image
+
+    frontier = pd.DataFrame({"target_return": [0.1, 0.12], "volatility": [0.2, 0.22]})
+    paletted = plot_efficient_frontier(frontier, tmp_path / "p.png")
+    full = plot_efficient_frontier(frontier, tmp_path / "f.png", quantize=False)
+
+    with Image.open(paletted) as image:
+        assert image.mode == "P"
+        assert len(image.getcolors()) <= visualizer._PALETTE_COLORS
+    with Image.open(full) as image:
+        assert image.mode == "RGBA"
+    assert paletted.stat().st_size < full.stat().st_size
+
+
+def test_plot_all_writes_every_chart(tmp_path: Path) -> None:
+    """Ensure the chart bundle saves all four files and reports them."""
+    metrics = pd.DataFrame(
+        {"vol_ann": [0.2, 0.3], "sharpe": [0.5, 0.8]},
+        index=["ETH", "BTC"],
+    )
+    corr = pd.DataFrame(
+        [[1.0, 0.2], [0.2, 1.0]],
+        index=["ETH", "BTC"],
+        columns=["ETH", "BTC"],
+    )
+    frontier = pd.DataFrame({"target_return": [0.1, 0.12], "volatility": [0.2, 0.22]})
+    paths = plot_all(metrics, corr, {"ETH": 0.6, "BTC": 0.4}, frontier, tmp_path)
+
+    assert set(paths) == {"risk_bars", "correlation_heatmap", "allocation", "frontier"}
+    assert all(path.exists() and path.parent == tmp_path for path in paths.values())
+    assert not list(tmp_path.glob("*.tmp"))  # atomic writes leave no temp files
@@ -7,133 +7,619 @@ to disk for the CLI outputs.
 
 from __future__ import annotations
 
+import hashlib
+import io
+import os
+import threading
+from contextlib import contextmanager
+from html import escape
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterator
 
 import matplotlib
+import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize, to_rgba
+from matplotlib.figure import Figure
+from PIL import Image
+
+# 100 dpi keeps CLI charts legible with ~30% fewer pixels to rasterize and
+# deflate than the former 120; pass ``dpi=`` for print-quality output.
+DEFAULT_DPI = 100
+
+# Flat-colour charts gain little from zlib's higher levels, which dominate
+# savefig time; level 3 encodes noticeably faster for a few KB more.
+_PNG_KWARGS = {"pil_kwargs": {"compress_level": 3, "optimize": False}}
+# The heatmap is a small bitmap where further zlib search is wasted work.
+_HEATMAP_PNG_KWARGS = {"pil_kwargs": {"compress_level": 1, "optimize": False}}
+# Flat-colour charts can be reduced to a small palette before PNG encoding:
+# rasterizing to RGBA and octree-quantizing is quicker than deflating the
+# full RGBA image, and the file comes out roughly half the size. The
+# heatmap's smooth colorbar gradient would band, so it never quantizes.
+_PALETTE_COLORS = 64
+
+# Charts saved to a ``.webp`` path use lossless WebP at its fastest preset
+# (method 0), which encodes quicker than PNG's deflate at a similar size.
+_WEBP_KWARGS = {"pil_kwargs": {"lossless": True, "quality": 50, "method": 0}}
+
+# The heatmap's [-1, 1] range is fixed, so its colours come straight from the
+# colormap's uint8 lookup table instead of a per-draw Normalize + cmap pass.
+# The extra last row is the colour for NaN (constant-price assets).
+_HEATMAP_CMAP = matplotlib.colormaps["coolwarm"]
+_HEATMAP_LUT = np.vstack(
+    [
+        _HEATMAP_CMAP(np.arange(_HEATMAP_CMAP.N), bytes=True),
+        _HEATMAP_CMAP(np.array([np.nan]), bytes=True),
+    ]
+)
+_HEATMAP_MAPPABLE = ScalarMappable(norm=Normalize(-1.0, 1.0), cmap=_HEATMAP_CMAP)
+
+# Columns plot_risk_bars needs from metrics_df.
+_RISK_BAR_COLUMNS = frozenset({"vol_ann", "sharpe"})
+# Bar colours parsed to RGBA once rather than from hex on every call.
+_VOL_COLOR = to_rgba("#4C78A8")
+_SHARPE_COLOR = to_rgba("#F58518")
+
+# Frontiers longer than this are LTTB-downsampled before plotting; beyond a
+# few hundred markers extra points only add artists, not visible shape.
+_FRONTIER_MAX_POINTS = 500
+
+# matplotlib's default "tab10" colour cycle, used by the hand-written SVG pie.
+_PIE_COLORS = (
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#7f7f7f",
+    "#bcbd22",
+    "#17becf",
+)
+
+# Each chart sets fixed subplot margins measured once from tight_layout() at
+# its figsize; the bbox-measuring layout pass is not rerun on every save.
+#
+# One Figure per (chart kind, figsize), cleared and redrawn on every call so
+# the figure and its Agg canvas are allocated once per process.
+_FIG_CACHE: dict[tuple[str, tuple[float, float]], Figure] = {}
+_FIG_LOCK = threading.RLock()
+
+# Output directories already created by this process.
+_ENSURED_DIRS: set[Path] = set()
+
+
+# Rendered charts memoized by a digest of their inputs, so a rerun over
+# unchanged data copies the previous file instead of redrawing it. Off
+# (``None``) unless enabled with :func:`set_chart_cache_dir`; the CLI turns
+# it on under the configured cache directory.
+_CHART_CACHE_DIR: Path | None = None
+# Most charts kept in the memo; the least recently used are evicted first.
+_CHART_CACHE_MAX_ENTRIES = 256
+# The PNG stream ends with an empty IEND chunk and its fixed CRC.
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_TRAILER = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+# Folded into every key so a matplotlib upgrade or an edit to this module
+# invalidates previously rendered charts.
+_RENDER_SALT = (
+    matplotlib.__version__.encode() + b"\0" + hashlib.blake2b(
+        Path(__file__).read_bytes(), digest_size=16
+    ).digest()
+)
+
+
+def _chart_key(kind: str, *parts: object) -> str:
+    """Digest a chart kind and its inputs into a chart cache key."""
+    digest = hashlib.blake2b(_RENDER_SALT, digest_size=16)
+    digest.update(kind.encode())
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(f"{part.dtype.str}{part.shape}".encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` once per process; later calls skip the mkdir syscalls."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _write_atomic(target: Path, data: bytes | memoryview) -> None:
+    """
+    Write ``data`` to ``target`` in one call via a temp file and rename.
+
+    Readers (and concurrent writers of the same path) only ever see the old
+    file or the complete new one, never a truncated image. A directory
+    removed since :func:`_ensure_dir` saw it is recreated once.
+    """
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            tmp.write_bytes(data)
+        except FileNotFoundError:
+            _ENSURED_DIRS.discard(target.parent)
+            _ensure_dir(target.parent)
+            tmp.write_bytes(data)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _image_format(output_path: Path) -> str:
+    """Return the raster format for ``output_path``: WebP by suffix, else PNG."""
+    return "webp" if output_path.suffix.lower() == ".webp" else "png"
+
+
+def _encode_chart(
+    fig: Figure, dpi: int, fmt: str, png_kwargs: dict, quantize: bool = False
+) -> memoryview:
+    """
+    Encode ``fig`` as ``fmt`` (``png`` or ``webp``) into memory.
+
+    With ``quantize``, PNG output is rasterized to RGBA and reduced to a
+    ``_PALETTE_COLORS`` palette before encoding.
+    """
+    buf = io.BytesIO()
+    if fmt == "webp":
+        fig.savefig(buf, format="webp", dpi=dpi, **_WEBP_KWARGS)
+    elif quantize:
+        fig.savefig(buf, format="rgba", dpi=dpi)
+        # Agg truncates the pixel size the same way.
+        size = (int(fig.get_figwidth() * dpi), int(fig.get_figheight() * dpi))
+        image = (
+            Image.frombuffer("RGBA", size, buf.getbuffer(), "raw", "RGBA", 0, 1)
+            .convert("RGB")
+            .quantize(_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+        )
+        buf = io.BytesIO()
+        image.save(buf, format="PNG", **png_kwargs["pil_kwargs"])
+    else:
+        fig.savefig(buf, format="png", dpi=dpi, **png_kwargs)
+    return buf.getbuffer()
+
+
+def set_chart_cache_dir(cache_dir: str | Path | None) -> None:
+    """
+    Enable the rendered-chart memo under ``cache_dir``, or disable it.
+
+    Library calls render every chart from scratch by default; the memo
+    only pays off for repeated runs over the same data, as in the CLI. At
+    most ``_CHART_CACHE_MAX_ENTRIES`` charts are kept.
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
+    Args:
+        cache_dir: Directory holding memoized charts, or ``None`` to turn
+            the memo off.
+    """
+    global _CHART_CACHE_DIR
+    _CHART_CACHE_DIR = Path(cache_dir) if cache_dir is not None else None
+
+
+def _is_complete_image(data: bytes, fmt: str) -> bool:
+    """Return whether ``data`` is a whole ``fmt`` file, not a torn write."""
+    if fmt == "webp":
+        # RIFF header: the little-endian size counts everything after it.
+        return (
+            data[:4] == b"RIFF"
+            and data[8:12] == b"WEBP"
+            and int.from_bytes(data[4:8], "little") == len(data) - 8
+        )
+    return data.startswith(_PNG_SIGNATURE) and data.endswith(_PNG_TRAILER)
+
+
+def _restore_chart(key: str, output_path: Path) -> bool:
+    """Copy a memoized chart to ``output_path``; return whether one existed."""
+    if _CHART_CACHE_DIR is None:
+        return False
+    entry = _CHART_CACHE_DIR / key
+    try:
+        data = entry.read_bytes()
+        if not _is_complete_image(data, _image_format(output_path)):
+            # Damaged on disk; drop it so the fresh render replaces it.
+            entry.unlink(missing_ok=True)
+            return False
+        os.utime(entry)  # Mark as recently used for eviction.
+    except OSError:
+        return False
+    _write_atomic(output_path, data)
+    return True
+
+
+def _evict_charts(cache_dir: Path) -> None:
+    """Delete the least recently used charts beyond the entry cap."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            entries.append((entry.stat().st_mtime, entry.path))
+    excess = len(entries) - _CHART_CACHE_MAX_ENTRIES
+    if excess > 0:
+        for _, path in sorted(entries)[:excess]:
+            Path(path).unlink(missing_ok=True)
+
+
+def _store_chart(key: str, data: bytes | memoryview) -> None:
+    """Memoize a freshly encoded chart; failures only cost the next rerun."""
+    if _CHART_CACHE_DIR is None:
+        return
+    try:
+        _ensure_dir(_CHART_CACHE_DIR)
+        _write_atomic(_CHART_CACHE_DIR / key, data)
+        _evict_charts(_CHART_CACHE_DIR)
+    except OSError:
+        pass
+
+
+def _pie_svg(labels: list[str], values: list[float]) -> str:
+    """
+    Draw the allocation pie as a standalone SVG document.
+
+    Mirrors the matplotlib chart: wedges run counter-clockwise from three
+    o'clock, names sit just outside the rim and percentages inside it.
+    Coordinates are points on a 6x6 inch canvas.
+    """
+    fractions = np.asarray(values, dtype=np.float64)
+    total = fractions.sum()
+    if (fractions < 0).any() or not total > 0:
+        raise ValueError("Allocation weights must be non-negative with a positive sum")
+    fractions = fractions / total
+
+    size, cx, cy, r = 432, 216.0, 224.0, 158.0
+    edges = 2.0 * np.pi * np.concatenate(([0.0], np.cumsum(fractions)))
+    mids = 0.5 * (edges[:-1] + edges[1:])
+    # SVG's y axis points down, hence the negated sines.
+    xs, ys = cx + r * np.cos(edges), cy - r * np.sin(edges)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="6in" height="6in" '
+        f'viewBox="0 0 {size} {size}" font-family="DejaVu Sans, sans-serif" '
+        f'font-size="10">',
+        f'<rect width="{size}" height="{size}" fill="white"/>',
+        f'<text x="{cx}" y="20" font-size="12" text-anchor="middle">Allocation</text>',
+    ]
+    for i, frac in enumerate(fractions):
+        color = _PIE_COLORS[i % len(_PIE_COLORS)]
+        if frac >= 1.0:
+            parts.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}"/>')
+        elif frac > 0.0:
+            large = int(frac > 0.5)
+            parts.append(
+                f'<path d="M{cx},{cy} L{xs[i]:.2f},{ys[i]:.2f} '
+                f"A{r},{r} 0 {large},0 {xs[i + 1]:.2f},{ys[i + 1]:.2f} Z\" "
+                f'fill="{color}"/>'
+            )
+    for label, frac, mid in zip(labels, fractions, mids):
+        cos, sin = np.cos(mid), np.sin(mid)
+        anchor = "start" if cos > 0 else "end"
+        parts.append(
+            f'<text x="{cx + 1.1 * r * cos:.2f}" y="{cy - 1.1 * r * sin:.2f}" '
+            f'text-anchor="{anchor}" dominant-baseline="middle">'
+            f"{escape(str(label))}</text>"
+        )
+        parts.append(
+            f'<text x="{cx + 0.6 * r * cos:.2f}" y="{cy - 0.6 * r * sin:.2f}" '
+            f'text-anchor="middle" dominant-baseline="middle">'
+            f"{100.0 * frac:.1f}%</text>"
+        )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick ``n_out`` points of a line with Largest-Triangle-Three-Buckets.
 
+    The first and last points are kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and
+    the mean of the next bucket, which preserves peaks and turns.
 
-def plot_risk_bars(metrics_df: pd.DataFrame, output_path: str | Path) -> Path:
+    Returns:
+        Increasing indices into ``x``/``y`` (all of them if already short).
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            nxt = slice(hi, edges[bucket + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        indices[bucket + 1] = a
+    return indices
+
+
+@contextmanager
+def _cached_figure(
+    kind: str,
+    figsize: tuple[float, float],
+    nrows: int = 1,
+    ncols: int = 1,
+    **subplot_kw,
+) -> Iterator[tuple[Figure, object]]:
+    """
+    Yield a cleared cached figure and fresh axes for one chart.
+
+    The lock is held for the whole render, since the figure is shared by
+    every call drawing the same kind of chart.
+    """
+    with _FIG_LOCK:
+        key = (kind, figsize)
+        fig = _FIG_CACHE.get(key)
+        if fig is None:
+            # Attached straight to an Agg canvas: no pyplot figure manager,
+            # no global current-figure state, nothing to close.
+            fig = _FIG_CACHE[key] = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        else:
+            fig.clear()
+        yield fig, fig.subplots(nrows, ncols, **subplot_kw)
+
+
+def plot_risk_bars(
+    metrics_df: pd.DataFrame,
+    output_path: str | Path,
+    dpi: int = DEFAULT_DPI,
+    quantize: bool = True,
+) -> Path:
     """
     Save a simple bar chart for volatility and Sharpe ratio per asset.
 
     Args:
         metrics_df: DataFrame indexed by asset with columns ``vol_ann`` and ``sharpe``.
-        output_path: Destination path for the PNG file.
+        output_path: Destination path for the PNG (or ``.webp``) file.
+        dpi: Resolution of the saved image.
+        quantize: Reduce PNG output to a small colour palette; smaller and
+            quicker to encode.
 
     Returns:
         The output path as a :class:`pathlib.Path`.
     """
-    required = {"vol_ann", "sharpe"}
-    missing = required.difference(metrics_df.columns)
+    missing = _RISK_BAR_COLUMNS.difference(metrics_df.columns)
     if missing:
         raise ValueError(f"Missing columns in metrics_df: {sorted(missing)}")
 
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_path.parent)
 
     assets = metrics_df.index.tolist()
-    fig, axes = plt.subplots(2, 1, figsize=(8, 6), sharex=True)
-
-    axes[0].bar(assets, metrics_df["vol_ann"].values, color="#4C78A8")
-    axes[0].set_title("Annualized Volatility")
-    axes[0].set_ylabel("Volatility")
-    axes[0].grid(axis="y", alpha=0.3)
-
-    axes[1].bar(assets, metrics_df["sharpe"].values, color="#F58518")
-    axes[1].set_title("Sharpe Ratio")
-    axes[1].set_ylabel("Sharpe")
-    axes[1].set_xlabel("Asset")
-    axes[1].grid(axis="y", alpha=0.3)
-    axes[1].tick_params(axis="x", rotation=45)
-
-    fig.tight_layout()
-    fig.savefig(output_path, dpi=120)
-    plt.close(fig)
+    vol = metrics_df["vol_ann"].to_numpy(copy=False)
+    sharpe = metrics_df["sharpe"].to_numpy(copy=False)
+    fmt = _image_format(output_path)
+    key = _chart_key("risk_bars", fmt, dpi, quantize, assets, vol, sharpe)
+    if _restore_chart(key, output_path):
+        return output_path
+
+    # Integer positions plus explicit tick labels skip matplotlib's categorical
+    # unit conversion for each bar call.
+    positions = np.arange(len(assets))
+    with _cached_figure("risk_bars", (8, 6), 2, 1, sharex=True) as (fig, axes):
+        axes[0].bar(positions, vol, color=_VOL_COLOR)
+        axes[0].set_title("Annualized Volatility")
+        axes[0].set_ylabel("Volatility")
+        axes[0].grid(axis="y", alpha=0.3)
+
+        axes[1].bar(positions, sharpe, color=_SHARPE_COLOR)
+        axes[1].set_title("Sharpe Ratio")
+        axes[1].set_ylabel("Sharpe")
+        axes[1].set_xlabel("Asset")
+        axes[1].grid(axis="y", alpha=0.3)
+        axes[1].set_xticks(positions, labels=assets, rotation=45)
+
+        fig.subplots_adjust(left=0.1, right=0.98, top=0.94, bottom=0.14, hspace=0.2)
+        image = _encode_chart(fig, dpi, fmt, _PNG_KWARGS, quantize)
+    _write_atomic(output_path, image)
+    _store_chart(key, image)
     return output_path
 
 
-def plot_correlation_heatmap(corr_df: pd.DataFrame, output_path: str | Path) -> Path:
+def plot_correlation_heatmap(
+    corr_df: pd.DataFrame, output_path: str | Path, dpi: int = DEFAULT_DPI
+) -> Path:
     """
     Save a heatmap of the correlation matrix.
 
     Args:
         corr_df: Square correlation matrix with asset labels as index/columns.
-        output_path: Destination path for the PNG file.
+        output_path: Destination path for the PNG (or ``.webp``) file.
+        dpi: Resolution of the saved image.
 
     Returns:
         The output path as a :class:`pathlib.Path`.
     """
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    fig, ax = plt.subplots(figsize=(6, 5))
-    cax = ax.imshow(corr_df.values, cmap="coolwarm", vmin=-1, vmax=1)
-    ax.set_title("Correlation Matrix")
-
-    labels = list(corr_df.columns)
-    ax.set_xticks(range(len(labels)))
-    ax.set_yticks(range(len(labels)))
-    ax.set_xticklabels(labels, rotation=45, ha="right")
-    ax.set_yticklabels(labels)
-
-    fig.colorbar(cax, ax=ax, fraction=0.046, pad=0.04)
-    fig.tight_layout()
-    fig.savefig(output_path, dpi=120)
-    plt.close(fig)
+    _ensure_dir(output_path.parent)
+
+    # float32 is plenty to bin values into the colormap's lookup table.
+    values = corr_df.to_numpy(dtype=np.float32)
+    labels = corr_df.columns.to_list()
+    fmt = _image_format(output_path)
+    key = _chart_key("correlation_heatmap", fmt, dpi, labels, values)
+    if _restore_chart(key, output_path):
+        return output_path
+
+    # Same binning as Colormap.__call__: scale [-1, 1] onto N bins, clip the
+    # top edge into the last one and send NaN to the "bad" row.
+    n_colors = _HEATMAP_CMAP.N
+    with np.errstate(invalid="ignore"):
+        idx = ((values + 1.0) * (n_colors / 2.0)).astype(np.intp)
+    np.clip(idx, 0, n_colors - 1, out=idx)
+    idx[np.isnan(values)] = n_colors
+    rgba = _HEATMAP_LUT[idx]
+
+    with _cached_figure("correlation_heatmap", (6, 5)) as (fig, ax):
+        ax.imshow(rgba, interpolation="nearest")
+        ax.set_title("Correlation Matrix")
+
+        positions = np.arange(len(labels))
+        ax.set_xticks(positions, labels=labels, rotation=45, ha="right")
+        ax.set_yticks(positions, labels=labels)
+
+        # Margins are set before the colorbar so it carves its slot out of
+        # the final axes box instead of being re-laid out afterwards.
+        fig.subplots_adjust(left=0.03, right=0.89, top=0.93, bottom=0.14)
+        fig.colorbar(_HEATMAP_MAPPABLE, ax=ax, fraction=0.046, pad=0.04)
+        image = _encode_chart(fig, dpi, fmt, _HEATMAP_PNG_KWARGS)
+    _write_atomic(output_path, image)
+    _store_chart(key, image)
     return output_path
 
 
-def plot_allocation_pie(weights: dict[str, float], output_path: str | Path) -> Path:
+def plot_allocation_pie(
+    weights: dict[str, float],
+    output_path: str | Path,
+    dpi: int = DEFAULT_DPI,
+    quantize: bool = True,
+) -> Path:
     """
     Save a pie chart of portfolio allocation.
 
+    Assets with a zero weight are left out and wedges run from the largest
+    weight to the smallest. A ``.svg`` output path is written directly as
+    SVG, skipping matplotlib entirely; ``.webp`` paths get lossless WebP
+    and any other path PNG.
+
     Args:
         weights: Mapping of asset to portfolio weight.
-        output_path: Destination path for the PNG file.
+        output_path: Destination path for the SVG, PNG or WebP file.
+        dpi: Resolution of the saved image (raster formats only).
+        quantize: Reduce PNG output to a small colour palette; smaller and
+            quicker to encode.
 
     Returns:
         The output path as a :class:`pathlib.Path`.
     """
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    labels = list(weights.keys())
-    values = list(weights.values())
-
-    fig, ax = plt.subplots(figsize=(6, 6))
-    ax.pie(values, labels=labels, autopct="%1.1f%%")
-    ax.set_title("Allocation")
-    fig.tight_layout()
-    fig.savefig(output_path, dpi=120)
-    plt.close(fig)
+    _ensure_dir(output_path.parent)
+
+    # Zero weights would only add empty wedges and stray labels; largest
+    # wedges first keeps the labels of small slices from piling up.
+    items = sorted(
+        ((asset, weight) for asset, weight in weights.items() if abs(weight) > 1e-6),
+        key=itemgetter(1),
+        reverse=True,
+    )
+    labels = [asset for asset, _ in items]
+    values = [weight for _, weight in items]
+    if output_path.suffix.lower() == ".svg":
+        _write_atomic(output_path, _pie_svg(labels, values).encode())
+        return output_path
+
+    fmt = _image_format(output_path)
+    key = _chart_key("allocation_pie", fmt, dpi, quantize, labels, values)
+    if _restore_chart(key, output_path):
+        return output_path
+
+    with _cached_figure("allocation_pie", (6, 6)) as (fig, ax):
+        ax.pie(values, labels=labels, autopct="%1.1f%%")
+        ax.set_title("Allocation")
+        fig.subplots_adjust(left=0.025, right=0.975, top=0.94, bottom=0.025)
+        image = _encode_chart(fig, dpi, fmt, _PNG_KWARGS, quantize)
+    _write_atomic(output_path, image)
+    _store_chart(key, image)
     return output_path
 
 
-def plot_efficient_frontier(frontier_df: pd.DataFrame, output_path: str | Path) -> Path:
+def plot_efficient_frontier(
+    frontier_df: pd.DataFrame,
+    output_path: str | Path,
+    dpi: int = DEFAULT_DPI,
+    quantize: bool = True,
+) -> Path:
     """
     Save the efficient frontier scatter plot.
 
     Args:
         frontier_df: DataFrame with columns ``target_return`` and ``volatility``.
-        output_path: Destination path for the PNG file.
+        output_path: Destination path for the PNG (or ``.webp``) file.
+        dpi: Resolution of the saved image.
+        quantize: Reduce PNG output to a small colour palette; smaller and
+            quicker to encode.
 
     Returns:
         The output path as a :class:`pathlib.Path`.
     """
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    fig, ax = plt.subplots(figsize=(6, 5))
-    ax.plot(frontier_df["volatility"], frontier_df["target_return"], marker="o")
-    ax.set_title("Efficient Frontier")
-    ax.set_xlabel("Volatility")
-    ax.set_ylabel("Return")
-    ax.grid(alpha=0.3)
-    fig.tight_layout()
-    fig.savefig(output_path, dpi=120)
-    plt.close(fig)
+    _ensure_dir(output_path.parent)
+
+    vol = frontier_df["volatility"].to_numpy(copy=False)
+    ret = frontier_df["target_return"].to_numpy(copy=False)
+    fmt = _image_format(output_path)
+    key = _chart_key("efficient_frontier", fmt, dpi, quantize, vol, ret)
+    if _restore_chart(key, output_path):
+        return output_path
+
+    marker_size = None
+    if len(vol) > _FRONTIER_MAX_POINTS:
+        keep = _lttb_indices(vol, ret, _FRONTIER_MAX_POINTS)
+        vol, ret = vol[keep], ret[keep]
+        marker_size = 3
+
+    with _cached_figure("efficient_frontier", (6, 5)) as (fig, ax):
+        ax.plot(vol, ret, marker="o", markersize=marker_size)
+        ax.set_title("Efficient Frontier")
+        ax.set_xlabel("Volatility")
+        ax.set_ylabel("Return")
+        ax.grid(alpha=0.3)
+        fig.subplots_adjust(left=0.14, right=0.975, top=0.93, bottom=0.12)
+        image = _encode_chart(fig, dpi, fmt, _PNG_KWARGS, quantize)
+    _write_atomic(output_path, image)
+    _store_chart(key, image)
     return output_path
+
+
+def plot_all(
+    metrics_df: pd.DataFrame,
+    corr_df: pd.DataFrame,
+    weights: dict[str, float],
+    frontier_df: pd.DataFrame,
+    out_dir: str | Path,
+    dpi: int = DEFAULT_DPI,
+) -> dict[str, Path]:
+    """
+    Save the full chart bundle.
+
+    The four charts are small and render serially in well under a second;
+    starting worker processes for them costs more than the drawing.
+
+    Args:
+        metrics_df: Per-asset metrics for :func:`plot_risk_bars`.
+        corr_df: Correlation matrix for :func:`plot_correlation_heatmap`.
+        weights: Allocation for :func:`plot_allocation_pie`.
+        frontier_df: Frontier points for :func:`plot_efficient_frontier`.
+        out_dir: Directory receiving the chart files.
+        dpi: Resolution of every saved image.
+
+    Returns:
+        Mapping of chart name (``risk_bars``, ``correlation_heatmap``,
+        ``allocation``, ``frontier``) to the saved path.
+    """
+    out_dir = Path(out_dir)
+    jobs = {
+        "risk_bars": (plot_risk_bars, metrics_df, out_dir / "risk_bars.png"),
+        "correlation_heatmap": (
+            plot_correlation_heatmap,
+            corr_df,
+            out_dir / "correlation_heatmap.png",
+        ),
+        "allocation": (plot_allocation_pie, weights, out_dir / "allocation.svg"),
+        "frontier": (plot_efficient_frontier, frontier_df, out_dir / "frontier.png"),
+    }
+    return {name: plot(data, path, dpi) for name, (plot, data, path) in jobs.items()}